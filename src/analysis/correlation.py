@@ -0,0 +1,156 @@
+import numpy as np
+import pandas as pd
+
+
+def prepare_acf_pacf_data(data, lags=40):
+    if isinstance(data, pd.DataFrame):
+        if data.shape[1] != 1:
+            raise ValueError("ACF/PACF expects a single series")
+        series = pd.to_numeric(data.iloc[:, 0], errors='coerce').dropna()
+    else:
+        series = pd.to_numeric(pd.Series(data), errors='coerce').dropna()
+
+    n = len(series)
+    if n < 5:
+        raise ValueError("Not enough data for ACF/PACF (need at least 5 observations).")
+
+    safe_lags = int(min(max(1, lags), max(1, n - 2)))
+    return series, safe_lags
+
+
+def acf_fft(values, nlags: int) -> np.ndarray:
+    """Sample autocorrelation for lags 0..nlags via FFT in O(n log n); same estimator as statsmodels acf(fft=True)."""
+    power, size = _power_spectrum(values)
+    return _acf_from_power(power, size, nlags)
+
+
+def _power_spectrum(values):
+    """|FFT|^2 of the demeaned values zero-padded to at least 2n - 1, so no circular overlap reaches the ACF."""
+    from scipy.fft import rfft, next_fast_len
+
+    x = np.asarray(values, dtype=np.float64)
+    x = x - x.mean()
+    size = next_fast_len(2 * len(x) - 1, real=True)
+    spectrum = rfft(x, size, workers=-1)
+    return spectrum.real ** 2 + spectrum.imag ** 2, size
+
+
+def _acf_from_power(power, size, nlags):
+    from scipy.fft import irfft
+
+    acov = irfft(power, size, workers=-1)[:nlags + 1]
+    if acov[0] == 0:
+        raise ValueError("ACF is undefined for a constant series")
+    return acov / acov[0]
+
+
+def pacf_durbin_levinson(acf: np.ndarray, nlags: int) -> np.ndarray:
+    """PACF for lags 0..nlags from an ACF by Durbin-Levinson (statsmodels' 'ywm'), NaN past a singular step."""
+    pacf = np.full(nlags + 1, np.nan)
+    pacf[0] = 1.0
+    phi = np.zeros(nlags)
+    variance = 1.0
+    for k in range(1, nlags + 1):
+        prev = phi[:k - 1]
+        reflection = (acf[k] - prev @ acf[k - 1:0:-1]) / variance
+        if not np.isfinite(reflection) or abs(reflection) >= 1:
+            if abs(reflection) == 1:
+                pacf[k] = reflection
+            break
+        phi[:k - 1] = prev - reflection * prev[::-1]
+        phi[k - 1] = reflection
+        pacf[k] = reflection
+        variance *= 1 - reflection ** 2
+    return pacf
+
+
+def compute_acf_pacf(data, lags=40, alpha=0.05) -> dict:
+    """ACF and PACF of one series with their confidence half-widths, as plain arrays for caching."""
+    from scipy.stats import norm
+
+    series, lags = prepare_acf_pacf_data(data, lags=lags)
+    values = series.to_numpy(dtype=np.float64)
+    n = len(values)
+    acf = acf_fft(values, lags)
+    pacf = pacf_durbin_levinson(acf, lags)
+
+    z = norm.ppf(1 - alpha / 2)
+    acf_var = np.empty(lags + 1)
+    acf_var[0] = 0.0
+    acf_var[1] = 1.0 / n
+    acf_var[2:] = (1 + 2 * np.cumsum(acf[1:-1] ** 2)) / n
+    pacf_bound = np.full(lags + 1, z / np.sqrt(n))
+    pacf_bound[0] = 0.0
+    return {
+        'lags': np.arange(lags + 1),
+        'acf': acf,
+        'pacf': pacf,
+        'acf_bound': z * np.sqrt(acf_var),
+        'pacf_bound': pacf_bound,
+        'nobs': n,
+        'alpha': alpha,
+    }
+
+
+def seasonal_period_candidates(data, max_candidates=3, min_period=2, max_period=None) -> list[tuple[int, float]]:
+    """Ranked (period, autocorrelation) pairs from periodogram peaks confirmed by ACF local maxima."""
+    if isinstance(data, pd.DataFrame):
+        if data.shape[1] != 1:
+            raise ValueError("Period detection expects a single series")
+        data = data.iloc[:, 0]
+    values = pd.to_numeric(pd.Series(data), errors='coerce').dropna().to_numpy(dtype=np.float64)
+    n = len(values)
+    max_period = n // 2 if max_period is None else min(int(max_period), n // 2)
+    if max_period < max(min_period, 2) + 1:
+        return []
+
+    t = np.arange(n, dtype=np.float64)
+    t -= t.mean()
+    values = values - values.mean()
+    values -= t * (t @ values) / (t @ t)
+    power, size = _power_spectrum(values)
+    if not power[1:].any():
+        return []
+    acf = _acf_from_power(power, size, min(max_period + 1, n - 1))
+
+    # Peaks come from a Hann-windowed periodogram, whose sidelobes fall off fast
+    # enough not to pass for periods of their own. Noise there is roughly
+    # exponential around median / ln 2; a peak must clear that floor with a
+    # Bonferroni-corrected 5% tail.
+    from scipy.fft import rfft, next_fast_len
+    from scipy.signal.windows import hann
+
+    size = next_fast_len(n, real=True)
+    spectrum = rfft(values * hann(n, sym=False), size, workers=-1)
+    periodogram = spectrum.real ** 2 + spectrum.imag ** 2
+    floor = np.median(periodogram[1:]) / np.log(2)
+    threshold = floor * np.log(n / 2 / 0.05)
+    inner = periodogram[1:-1]
+    peaks = np.flatnonzero((inner > periodogram[:-2]) & (inner >= periodogram[2:]) & (inner > threshold)) + 1
+    # Parabolic interpolation of the log peak places it to a fraction of a bin.
+    a, b, c = (np.log(periodogram[peaks + shift]) for shift in (-1, 0, 1))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        offset = np.nan_to_num(0.5 * (a - c) / (a - 2 * b + c))
+    periods = size / (peaks + np.clip(offset, -0.5, 0.5))
+    keep = (periods >= min_period - 0.5) & (periods <= max_period + 0.5)
+    peaks, periods = peaks[keep], periods[keep]
+    order = np.argsort(periodogram[peaks])[::-1]
+
+    bound = 1.96 / np.sqrt(n)
+    candidates = []
+    for period in periods[order]:
+        if len(candidates) >= max_candidates:
+            break
+        lo = max(int(np.floor(period * 0.9)), min_period, 1)
+        hi = min(int(np.ceil(period * 1.1)), max_period, len(acf) - 2)
+        if lo > hi:
+            continue
+        window = acf[lo:hi + 1]
+        # Lags tied with the ACF maximum within noise go to the one closest to the spectral estimate.
+        near = lo + np.flatnonzero(window >= window.max() - bound)
+        best = int(near[np.argmin(np.abs(near - period))])
+        if acf[best] <= bound or acf[best] < acf[best - 1] - bound or acf[best] < acf[best + 1] - bound:
+            continue
+        if all(abs(best - c) > max(1, 0.1 * c) for c, _ in candidates):
+            candidates.append((best, float(acf[best])))
+    return candidates
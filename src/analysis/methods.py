@@ -1,9 +1,10 @@
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-from statsmodels.graphics.tsaplots import plot_acf as _plot_acf, plot_pacf as _plot_pacf
+from matplotlib.figure import Figure
 from scipy import stats as scipy_stats
 
+from src.analysis.correlation import prepare_acf_pacf_data, compute_acf_pacf, seasonal_period_candidates
+
 
 def plot_distribution(data, title_prefix="Distribution"):
 
@@ -16,7 +17,8 @@ def plot_distribution(data, title_prefix="Distribution"):
         series = pd.to_numeric(pd.Series(data), errors='coerce').dropna()
         name = getattr(data, 'name', 'value')
 
-    fig, axes = plt.subplots(1, 2, figsize=(10, 4))
+    fig = Figure(figsize=(10, 4))
+    axes = fig.subplots(1, 2)
     axes[0].hist(series, bins='auto', alpha=0.7, color='steelblue', edgecolor='black')
     try:
         series.plot(kind='kde', ax=axes[0], color='orange')
@@ -28,7 +30,7 @@ def plot_distribution(data, title_prefix="Distribution"):
     scipy_stats.probplot(series, dist="norm", plot=axes[1])
     axes[1].set_title("QQ Plot")
     axes[1].grid(True, alpha=0.3)
-    plt.tight_layout()
+    fig.tight_layout()
     return fig
 
 
@@ -48,14 +50,15 @@ def plot_before_after(original, transformed, title_prefix="Transform"):
         trans_series = pd.to_numeric(pd.Series(transformed), errors='coerce')
         trans_name = getattr(transformed, 'name', 'transformed')
 
-    fig, axes = plt.subplots(1, 2, figsize=(12, 4), sharex=False)
+    fig = Figure(figsize=(12, 4))
+    axes = fig.subplots(1, 2, sharex=False)
     axes[0].plot(orig_series.index, orig_series.values, color='steelblue')
     axes[0].set_title(f"{title_prefix}: Original ({orig_name})")
     axes[0].grid(True, alpha=0.3)
     axes[1].plot(trans_series.index, trans_series.values, color='orange')
     axes[1].set_title(f"{title_prefix}: Transformed ({trans_name})")
     axes[1].grid(True, alpha=0.3)
-    plt.tight_layout()
+    fig.tight_layout()
     return fig
 
 
@@ -76,7 +79,10 @@ def seasonal_decompose(data, model='additive', period=None):
         raise ValueError("Not enough data points for seasonal decomposition")
 
     if period is None:
-        if len(series_clean) >= 24:
+        candidates = seasonal_period_candidates(series_clean, max_candidates=1)
+        if candidates:
+            period = candidates[0][0]
+        elif len(series_clean) >= 24:
             period = 12
         elif len(series_clean) >= 14:
             period = 7
@@ -85,22 +91,10 @@ def seasonal_decompose(data, model='additive', period=None):
 
     period = max(2, min(period, len(series_clean) // 2))
 
-    if len(series_clean) < 2 * period:
-        period = max(2, len(series_clean) // 2)
-
     try:
-        result = sm_seasonal_decompose(series_clean, model=model, period=period)
-        return result
+        return sm_seasonal_decompose(series_clean, model=model, period=period)
     except Exception as e:
-        if period > 2:
-            try:
-                period = max(2, period // 2)
-                result = sm_seasonal_decompose(series_clean, model=model, period=period)
-                return result
-            except Exception as e2:
-                raise ValueError(f"Seasonal decomposition failed with period {period}: {str(e2)}")
-        else:
-            raise ValueError(f"Seasonal decomposition failed: {str(e)}")
+        raise ValueError(f"Seasonal decomposition failed with period {period}: {str(e)}")
 
 
 def plot_seasonal_decomposition(data, model='additive', period=None, figsize=(10, 8)):
@@ -109,7 +103,8 @@ def plot_seasonal_decomposition(data, model='additive', period=None, figsize=(10
 
 
 def build_seasonal_decomposition_figure(decomposition, figsize=(10, 8)):
-    fig, axes = plt.subplots(4, 1, figsize=figsize, sharex=True)
+    fig = Figure(figsize=figsize)
+    axes = fig.subplots(4, 1, sharex=True)
     fig.suptitle('Seasonal Decomposition', fontsize=14)
 
     decomp_index = decomposition.observed.index
@@ -134,38 +129,29 @@ def build_seasonal_decomposition_figure(decomposition, figsize=(10, 8)):
     axes[3].legend()
     axes[3].grid(True, alpha=0.3)
 
-    plt.tight_layout()
+    fig.tight_layout()
     return fig
 
 
 def plot_acf_pacf(data, lags=40):
-    series, safe_lags = prepare_acf_pacf_data(data, lags)
-    return build_acf_pacf_figure(series, safe_lags)
-
-
-def prepare_acf_pacf_data(data, lags=40):
-    if isinstance(data, pd.DataFrame):
-        if data.shape[1] != 1:
-            raise ValueError("ACF/PACF expects a single series")
-        series = pd.to_numeric(data.iloc[:, 0], errors='coerce').dropna()
-    else:
-        series = pd.to_numeric(pd.Series(data), errors='coerce').dropna()
-
-    n = len(series)
-    if n < 5:
-        raise ValueError("Not enough data for ACF/PACF (need at least 5 observations).")
-
-    safe_lags = int(min(max(1, lags), max(1, n - 2)))
-    return series, safe_lags
-
-
-def build_acf_pacf_figure(series, lags):
-    fig, axes = plt.subplots(1, 2, figsize=(12, 4))
-    _plot_acf(series, lags=lags, ax=axes[0])
-    axes[0].set_title('ACF')
-    _plot_pacf(series, lags=lags, ax=axes[1], method='ywm')
-    axes[1].set_title('PACF')
-    plt.tight_layout()
+    return build_acf_pacf_figure(compute_acf_pacf(data, lags=lags))
+
+
+def build_acf_pacf_figure(result):
+    """Render the output of compute_acf_pacf(); lags into the thousands are drawn as one line collection."""
+    fig = Figure(figsize=(12, 4))
+    axes = fig.subplots(1, 2)
+    lags = result['lags']
+    for ax, name in zip(axes, ('acf', 'pacf')):
+        values, bound = result[name], result[f'{name}_bound']
+        ax.fill_between(lags, -bound, bound, alpha=0.25, linewidth=0)
+        ax.vlines(lags, 0, values, linewidth=1)
+        if len(lags) <= 200:
+            ax.plot(lags, values, 'o', markersize=4)
+        ax.axhline(0, color='black', linewidth=0.8)
+        ax.set_xlim(-1, lags[-1] + 1)
+        ax.set_title(name.upper())
+    fig.tight_layout()
     return fig
 
 
@@ -1,12 +1,14 @@
+import numpy as np
 import pandas as pd
 from sklearn.ensemble import IsolationForest
+from src.preprocessing.methods import numeric_matrix
 
 
 def zscore_anomalies(data, threshold=3.0):
 
     if isinstance(data, pd.DataFrame):
         if data.shape[1] != 1:
-            raise ValueError("Z-Score expects a single series")
+            return _zscore_anomalies_matrix(data, threshold)
         series_name = data.columns[0]
         series = pd.to_numeric(data.iloc[:, 0], errors='coerce')
     else:
@@ -24,6 +26,18 @@ def zscore_anomalies(data, threshold=3.0):
     return z_df, mask, anomalies_df
 
 
+def _zscore_anomalies_matrix(data, threshold):
+    values = numeric_matrix(data)
+    std = np.nanstd(values, axis=0)
+    std[std == 0] = 1.0
+    z = (values - np.nanmean(values, axis=0)) / std
+    with np.errstate(invalid='ignore'):
+        mask = np.abs(z) >= threshold
+    z_df = pd.DataFrame(z, index=data.index, columns=data.columns)
+    anomalies_df = pd.DataFrame(np.where(mask, values, np.nan), index=data.index, columns=data.columns)
+    return z_df, pd.Series(mask.any(axis=1), index=data.index), anomalies_df
+
+
 def isolation_forest_anomalies(data, contamination=0.01, random_state=42):
 
     if isinstance(data, pd.DataFrame):
@@ -0,0 +1,200 @@
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.data_ingestion.csv_loader import load_csv
+
+
+DEFAULT_CACHE_DIR = Path(os.environ.get('QLAB_CACHE_DIR', Path.home() / '.cache' / 'qlab' / 'csv'))
+DEFAULT_CACHE_BYTES = 2 * 1024 ** 3
+_HASH_BLOCK = 1024 * 1024
+_FORMAT_VERSION = 1
+
+
+def file_fingerprint(path) -> dict:
+    """Cheap identity of a file: path, size, mtime and a hash of its first and last megabyte."""
+    file = Path(path).resolve()
+    stat = file.stat()
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(str(stat.st_size).encode())
+    with open(file, 'rb') as f:
+        digest.update(f.read(_HASH_BLOCK))
+        if stat.st_size > 2 * _HASH_BLOCK:
+            f.seek(-_HASH_BLOCK, os.SEEK_END)
+            digest.update(f.read(_HASH_BLOCK))
+    return {
+        'path': str(file),
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'content': digest.hexdigest(),
+    }
+
+
+def frame_fingerprint(data) -> str:
+    """Content hash of a DataFrame or Series: column names, dtypes, index and values."""
+    df = data.to_frame() if isinstance(data, pd.Series) else data
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(json.dumps([[str(c) for c in df.columns], [str(t) for t in df.dtypes], str(df.index.dtype), len(df)]).encode())
+    for values in [df.index] + [df.iloc[:, i] for i in range(df.shape[1])]:
+        if isinstance(values.dtype, pd.DatetimeTZDtype) or isinstance(values, pd.DatetimeIndex):
+            array = values.asi8 if isinstance(values, pd.Index) else values.array.asi8
+        else:
+            array = values.to_numpy()
+        if array.dtype == object or not isinstance(array, np.ndarray):
+            array = pd.util.hash_array(np.asarray(array, dtype=object))
+        digest.update(np.ascontiguousarray(array).view(np.uint8))
+    return digest.hexdigest()
+
+
+class CsvCache:
+    """LRU on-disk cache of parsed CSV frames, one .npy file per column, valid while the file is unchanged."""
+
+    def __init__(self, root=None, max_bytes: int = DEFAULT_CACHE_BYTES):
+        self.root = Path(root) if root is not None else DEFAULT_CACHE_DIR
+        self.max_bytes = max_bytes
+
+    def get(self, path, **load_kwargs) -> pd.DataFrame | None:
+        entry = self._entry_dir(path, load_kwargs)
+        meta_file = entry / 'meta.json'
+        if not meta_file.exists():
+            return None
+        try:
+            meta = json.loads(meta_file.read_text())
+            if meta.get('version') != _FORMAT_VERSION or meta.get('fingerprint') != file_fingerprint(path):
+                return None
+            df = _read_frame(entry, meta)
+        except (OSError, ValueError, KeyError):
+            return None
+        os.utime(meta_file)
+        return df
+
+    def put(self, path, df: pd.DataFrame, **load_kwargs):
+        entry = self._entry_dir(path, load_kwargs)
+        tmp = entry.with_name(entry.name + f'.tmp{os.getpid()}')
+        shutil.rmtree(tmp, ignore_errors=True)
+        tmp.mkdir(parents=True)
+        try:
+            meta = _write_frame(tmp, df)
+            meta['version'] = _FORMAT_VERSION
+            meta['fingerprint'] = file_fingerprint(path)
+            (tmp / 'meta.json').write_text(json.dumps(meta))
+            shutil.rmtree(entry, ignore_errors=True)
+            tmp.rename(entry)
+        except Exception:
+            shutil.rmtree(tmp, ignore_errors=True)
+            raise
+        self._evict()
+
+    def clear(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def size_bytes(self) -> int:
+        return sum(size for _, _, size in self._entries())
+
+    def _entry_dir(self, path, load_kwargs) -> Path:
+        options = {k: v for k, v in sorted(load_kwargs.items()) if k not in ('progress_callback', 'max_memory')}
+        key = json.dumps([str(Path(path).resolve()), options], default=str)
+        return self.root / hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+
+    def _entries(self):
+        if not self.root.exists():
+            return []
+        entries = []
+        for entry in self.root.iterdir():
+            meta_file = entry / 'meta.json'
+            if not entry.is_dir() or not meta_file.exists():
+                continue
+            size = sum(f.stat().st_size for f in entry.iterdir())
+            entries.append((meta_file.stat().st_mtime, entry, size))
+        return entries
+
+    def _evict(self):
+        entries = sorted(self._entries(), key=lambda e: e[0])
+        total = sum(size for _, _, size in entries)
+        for _, entry, size in entries:
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+
+
+_default_cache = None
+
+
+def load_csv_cached(path, cache: CsvCache = None, **load_kwargs) -> pd.DataFrame:
+    global _default_cache
+    if cache is None:
+        if _default_cache is None:
+            _default_cache = CsvCache()
+        cache = _default_cache
+
+    df = cache.get(path, **load_kwargs)
+    if df is not None:
+        return df
+
+    df = load_csv(path, **load_kwargs)
+    try:
+        cache.put(path, df, **load_kwargs)
+    except OSError:
+        pass
+    return df
+
+
+def _write_frame(target: Path, df: pd.DataFrame) -> dict:
+    meta = {
+        'columns': [str(c) for c in df.columns],
+        'index': _write_array(target, 'index', df.index),
+        'index_name': df.index.name,
+        'dtypes': [],
+        'attrs': {k: v for k, v in df.attrs.items() if isinstance(v, (int, float, str, bool))},
+    }
+    for i, col in enumerate(df.columns):
+        meta['dtypes'].append(_write_array(target, f'col_{i}', df[col]))
+    return meta
+
+
+def _write_array(target: Path, name: str, values) -> dict:
+    dtype = values.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        np.save(target / f'{name}.npy', np.asarray(values.cat.codes if isinstance(values, pd.Series) else values.codes))
+        np.save(target / f'{name}.categories.npy', np.asarray(dtype.categories, dtype=object), allow_pickle=True)
+        return {'kind': 'category', 'ordered': bool(dtype.ordered)}
+    if isinstance(dtype, pd.DatetimeTZDtype):
+        np.save(target / f'{name}.npy', np.asarray(values.astype('int64')))
+        return {'kind': 'datetime_tz', 'tz': str(dtype.tz), 'unit': dtype.unit}
+    if isinstance(values, pd.RangeIndex):
+        return {'kind': 'range', 'start': values.start, 'stop': values.stop, 'step': values.step}
+    array = np.asarray(values)
+    if array.dtype == object:
+        np.save(target / f'{name}.npy', array, allow_pickle=True)
+        return {'kind': 'object'}
+    np.save(target / f'{name}.npy', array)
+    return {'kind': 'numpy'}
+
+
+def _read_array(source: Path, name: str, spec: dict):
+    kind = spec['kind']
+    if kind == 'range':
+        return pd.RangeIndex(spec['start'], spec['stop'], spec['step'])
+    if kind == 'category':
+        codes = np.load(source / f'{name}.npy')
+        categories = np.load(source / f'{name}.categories.npy', allow_pickle=True)
+        return pd.Categorical.from_codes(codes, categories=categories, ordered=spec['ordered'])
+    if kind == 'datetime_tz':
+        ints = np.load(source / f'{name}.npy')
+        return pd.DatetimeIndex(ints.view(f"datetime64[{spec['unit']}]")).tz_localize('UTC').tz_convert(spec['tz'])
+    return np.load(source / f'{name}.npy', allow_pickle=(kind == 'object'))
+
+
+def _read_frame(source: Path, meta: dict) -> pd.DataFrame:
+    index = pd.Index(_read_array(source, 'index', meta['index']), name=meta['index_name'])
+    data = {i: _read_array(source, f'col_{i}', spec) for i, spec in enumerate(meta['dtypes'])}
+    df = pd.DataFrame(data, index=index, copy=False)
+    df.columns = meta['columns']
+    df.attrs.update(meta['attrs'])
+    return df
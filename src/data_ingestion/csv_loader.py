@@ -1,48 +1,477 @@
+import numpy as np
 import pandas as pd
+from pandas.tseries.api import guess_datetime_format
 from pathlib import Path
 from dateutil.parser import parse as date_parse
 import csv
 
 
+STREAMING_THRESHOLD_BYTES = 256 * 1024 * 1024
+DEFAULT_CHUNK_BYTES = 64 * 1024 * 1024
+_INFERENCE_ROWS = 10_000
+_FORMAT_SAMPLE_ROWS = 1_000
+HEADER_SAMPLE_ROWS = 200
+CATEGORY_MAX_RATIO = 0.5
+
+
 def load_csv(
         path: str,
         date_col: str = None,
         index_col: str = None,
-        datetime_cols: list[str] = None
+        datetime_cols: list[str] = None,
+        usecols: list[str] = None,
+        chunksize: int = None,
+        max_memory: int = None,
+        progress_callback=None,
+        compact: bool = False
+) -> pd.DataFrame:
+    file = Path(path)
+    if not file.exists():
+        raise FileNotFoundError(f"CSV file not found: {path}")
+
+    if chunksize or max_memory or file.stat().st_size > STREAMING_THRESHOLD_BYTES:
+        return load_csv_streaming(
+            file,
+            date_col=date_col,
+            index_col=index_col,
+            datetime_cols=datetime_cols,
+            usecols=usecols,
+            chunksize=chunksize,
+            max_memory=max_memory,
+            progress_callback=progress_callback,
+            compact=compact,
+        )
+
+    delimiter = _sniff_delimiter(file)
+    projection = _projection(file, delimiter, usecols, date_col, index_col, datetime_cols)
+    df = read_csv_frame(file, delimiter, projection, date_col, index_col, datetime_cols, compact)
+
+    if progress_callback is not None:
+        size = file.stat().st_size
+        progress_callback(size, size)
+
+    return df
+
+
+def read_csv_frame(source, delimiter, projection, date_col=None, index_col=None, datetime_cols=None, compact=False) -> pd.DataFrame:
+    df = pd.read_csv(source, delimiter=delimiter, **projection)
+    df.columns = df.columns.str.strip().str.lower()
+
+    candidates = _datetime_candidates(df.columns, date_col, index_col, datetime_cols)
+    df, _, fallback_rows = _apply_datetime_index(df, candidates)
+    df.attrs['datetime_fallback_rows'] = fallback_rows
+
+    for col in df.columns:
+        try:
+            df[col] = pd.to_numeric(df[col])
+        except Exception:
+            pass
+
+    if compact:
+        df = compact_frame(df)
+    return df
+
+
+def load_csv_streaming(
+        path: str,
+        date_col: str = None,
+        index_col: str = None,
+        datetime_cols: list[str] = None,
+        usecols: list[str] = None,
+        chunksize: int = None,
+        max_memory: int = None,
+        progress_callback=None,
+        compact: bool = False
+) -> pd.DataFrame:
+    file = Path(path)
+    total_bytes = file.stat().st_size
+    read_bytes = [0]
+
+    def track(done, total):
+        read_bytes[0] = done
+        if progress_callback is not None:
+            progress_callback(done, total)
+
+    index = None
+    columns = None
+    rows = 0
+    fallback_rows = 0
+
+    for chunk in iter_csv_chunks(
+            file,
+            date_col=date_col,
+            index_col=index_col,
+            datetime_cols=datetime_cols,
+            usecols=usecols,
+            chunksize=chunksize,
+            progress_callback=track,
+    ):
+        fallback_rows += chunk.attrs.get('datetime_fallback_rows', 0)
+        if compact:
+            chunk = compact_frame(chunk)
+        n = len(chunk)
+        if columns is None:
+            estimate = n * total_bytes // max(1, read_bytes[0]) if read_bytes[0] else 2 * n
+            capacity = max(n, int(estimate * 1.05))
+            index = _ColumnBuilder(capacity, chunk.index)
+            columns = {col: _ColumnBuilder(capacity, chunk[col]) for col in chunk.columns}
+
+        builders = [(index, chunk.index)] + [(columns[col], chunk[col]) for col in chunk.columns]
+        if max_memory is not None:
+            held = int(chunk.memory_usage(index=True, deep=True).sum())
+            held += sum(b.nbytes + b.growth_bytes(rows + n, values) for b, values in builders)
+            if held > max_memory:
+                raise MemoryError(
+                    f"Loading {file.name} exceeds the memory cap of {max_memory} bytes"
+                )
+        for builder, values in builders:
+            builder.append(values, rows)
+        rows += n
+        del chunk, builders
+
+    if columns is None:
+        delimiter = _sniff_delimiter(file)
+        projection = _projection(file, delimiter, usecols, date_col, index_col, datetime_cols)
+        return pd.read_csv(file, delimiter=delimiter, nrows=0, **projection).rename(columns=lambda c: c.strip().lower())
+
+    data = {col: builder.finish(rows) for col, builder in columns.items()}
+    df = pd.DataFrame(data, index=index.finish(rows, as_index=True), copy=False)
+    df.attrs = {'datetime_fallback_rows': fallback_rows}
+    return df
+
+
+class _ColumnBuilder:
+    def __init__(self, capacity, first):
+        self.capacity = capacity
+        self.name = first.name
+        self.is_datetime = isinstance(first, pd.DatetimeIndex)
+        self.tz = first.tz if self.is_datetime else None
+        self.categories = first.cat.categories[:0] if isinstance(first, pd.Series) and isinstance(first.dtype, pd.CategoricalDtype) else None
+        self.values = None
+        self.string_bytes = 0
+
+    @property
+    def nbytes(self) -> int:
+        return (0 if self.values is None else self.values.nbytes) + self.string_bytes
+
+    def growth_bytes(self, needed, values) -> int:
+        dtype = self._incoming_dtype(values)
+        if self.values is None:
+            return max(needed, self.capacity) * dtype.itemsize
+        merged = _merged_dtype(self.values.dtype, dtype)
+        if needed <= self.capacity and merged == self.values.dtype:
+            return 0
+        return self._next_capacity(needed) * merged.itemsize
+
+    def append(self, values, start):
+        data = self._raw(values)
+        n = len(data)
+        if self.values is None:
+            self.values = np.empty(max(self.capacity, start + n), dtype=data.dtype)
+        dtype = _merged_dtype(self.values.dtype, data.dtype)
+        if start + n > self.capacity or dtype != self.values.dtype:
+            self.capacity = self._next_capacity(start + n) if start + n > self.capacity else self.capacity
+            grown = np.empty(self.capacity, dtype=dtype)
+            grown[:start] = self.values[:start]
+            self.values = grown
+        self.values[start:start + n] = data
+        if data.dtype == object:
+            self.string_bytes += max(0, int(pd.Series(data, copy=False).memory_usage(index=False, deep=True)) - data.nbytes)
+
+    def finish(self, rows, as_index=False):
+        values, self.values = self.values, None
+        try:
+            values.resize(rows, refcheck=False)
+        except ValueError:
+            values = values[:rows].copy()
+        if self.categories is not None:
+            return pd.Categorical.from_codes(values, self.categories)
+        if self.is_datetime:
+            index = pd.DatetimeIndex(values.view('datetime64[ns]'), name=self.name)
+            return index.tz_localize('UTC').tz_convert(self.tz) if self.tz is not None else index
+        if as_index:
+            return pd.Index(values, name=self.name)
+        return values
+
+    def _incoming_dtype(self, values) -> np.dtype:
+        if self.is_datetime:
+            return np.dtype(np.int64)
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            return np.dtype(np.int32) if self.categories is not None else np.dtype(object)
+        if self.categories is not None or not isinstance(values.dtype, np.dtype):
+            return np.dtype(object)
+        return values.dtype
+
+    def _raw(self, values) -> np.ndarray:
+        if self.is_datetime:
+            index = pd.DatetimeIndex(values)
+            return (index.tz_convert('UTC').tz_localize(None) if index.tz is not None else index).as_unit('ns').asi8
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            if self.categories is not None:
+                return self._merge_codes(values.cat)
+            return values.to_numpy(dtype=object)
+        if self.categories is not None:
+            self._decategorize()
+        return np.asarray(values.to_numpy())
+
+    def _merge_codes(self, cat) -> np.ndarray:
+        new = cat.categories.difference(self.categories, sort=False)
+        if len(new):
+            self.categories = self.categories.append(new)
+        mapping = self.categories.get_indexer(cat.categories).astype(np.int32)
+        codes = cat.codes.to_numpy()
+        return np.where(codes >= 0, mapping[codes], -1).astype(np.int32)
+
+    def _decategorize(self):
+        if self.values is not None:
+            codes = self.values
+            valid = (codes >= 0) & (codes < len(self.categories))
+            decoded = np.full(len(codes), np.nan, dtype=object)
+            decoded[valid] = self.categories.to_numpy(dtype=object)[codes[valid]]
+            self.values = decoded
+        self.categories = None
+
+    def _next_capacity(self, needed) -> int:
+        return max(needed, self.capacity + self.capacity // 2)
+
+
+def _merged_dtype(current: np.dtype, incoming: np.dtype) -> np.dtype:
+    try:
+        return np.result_type(current, incoming)
+    except TypeError:
+        return np.dtype(object)
+
+
+def iter_csv_chunks(
+        path: str,
+        date_col: str = None,
+        index_col: str = None,
+        datetime_cols: list[str] = None,
+        usecols: list[str] = None,
+        chunksize: int = None,
+        progress_callback=None
+):
+    file = Path(path)
+    if not file.exists():
+        raise FileNotFoundError(f"CSV file not found: {path}")
+
+    delimiter = _sniff_delimiter(file)
+    projection = _projection(file, delimiter, usecols, date_col, index_col, datetime_cols)
+    total_bytes = file.stat().st_size
+
+    numeric_cols = None
+    candidates = None
+    datetime_format = None
+
+    with open(file, 'rb') as handle:
+        reader = pd.read_csv(handle, delimiter=delimiter, chunksize=chunksize or _INFERENCE_ROWS, **projection)
+        rows_per_chunk = chunksize
+        with reader:
+            while True:
+                try:
+                    chunk = reader.get_chunk(rows_per_chunk)
+                except StopIteration:
+                    break
+                chunk.columns = chunk.columns.str.strip().str.lower()
+
+                if numeric_cols is None:
+                    if rows_per_chunk is None:
+                        raw_bytes = int(chunk.memory_usage(index=True, deep=True).sum())
+                        per_row = max(1, raw_bytes // max(1, len(chunk)))
+                        rows_per_chunk = max(1, DEFAULT_CHUNK_BYTES // per_row)
+                    candidates = _datetime_candidates(chunk.columns, date_col, index_col, datetime_cols)
+                    chunk, datetime_format, fallback = _apply_datetime_index(chunk, candidates)
+                    numeric_cols = []
+                    for col in chunk.columns:
+                        try:
+                            chunk[col] = pd.to_numeric(chunk[col])
+                            numeric_cols.append(col)
+                        except Exception:
+                            pass
+                else:
+                    chunk, _, fallback = _apply_datetime_index(chunk, candidates, datetime_format)
+                    for col in numeric_cols:
+                        chunk[col] = pd.to_numeric(chunk[col], errors='coerce')
+
+                chunk.attrs['datetime_fallback_rows'] = fallback
+                if progress_callback is not None:
+                    progress_callback(min(handle.tell(), total_bytes), total_bytes)
+                yield chunk
+
+    if progress_callback is not None:
+        progress_callback(total_bytes, total_bytes)
+
+
+def compact_frame(df: pd.DataFrame, float_tolerance: float = 0.0, category_ratio: float = CATEGORY_MAX_RATIO) -> pd.DataFrame:
+    out = {}
+    for col in df.columns:
+        series = df[col]
+        if pd.api.types.is_bool_dtype(series):
+            out[col] = series
+        elif pd.api.types.is_integer_dtype(series):
+            out[col] = pd.to_numeric(series, downcast='integer')
+        elif pd.api.types.is_float_dtype(series) and series.dtype != np.float32:
+            values = series.to_numpy(dtype=np.float64)
+            narrowed = values.astype(np.float32)
+            error = np.abs(narrowed.astype(np.float64) - values)
+            if float_tolerance > 0:
+                error = error / np.maximum(np.abs(values), np.finfo(np.float64).tiny)
+            with np.errstate(invalid='ignore'):
+                lossless = np.all((error <= float_tolerance) | np.isnan(values))
+            out[col] = pd.Series(narrowed, index=series.index, name=col) if lossless else series
+        elif series.dtype == object and len(series):
+            if series.nunique(dropna=True) <= category_ratio * len(series):
+                out[col] = series.astype('category')
+            else:
+                out[col] = series
+        else:
+            out[col] = series
+    compacted = pd.DataFrame(out, index=df.index)
+    compacted.columns = df.columns
+    compacted.attrs = dict(df.attrs)
+    return compacted
+
+
+def frame_memory(df: pd.DataFrame) -> tuple[int, int]:
+    resident = mapped = 0
+    arrays = [(df.index, df.index.nbytes if isinstance(df.index, pd.DatetimeIndex) else df.index.memory_usage(deep=True))]
+    arrays += [(df[c], int(df[c].memory_usage(index=False, deep=True))) for c in df.columns]
+    for values, nbytes in arrays:
+        if _is_memory_mapped(values):
+            mapped += int(nbytes)
+        else:
+            resident += int(nbytes)
+    return resident, mapped
+
+
+def _is_memory_mapped(values) -> bool:
+    try:
+        array = values.to_numpy(copy=False) if hasattr(values, 'to_numpy') else np.asarray(values)
+    except (TypeError, ValueError):
+        return False
+    base = array
+    while base is not None:
+        if isinstance(base, np.memmap):
+            return True
+        base = getattr(base, 'base', None)
+    return False
+
+
+def scan_csv_header(
+        path: str,
+        date_col: str = None,
+        index_col: str = None,
+        datetime_cols: list[str] = None,
+        sample_rows: int = HEADER_SAMPLE_ROWS
 ) -> pd.DataFrame:
     file = Path(path)
     if not file.exists():
         raise FileNotFoundError(f"CSV file not found: {path}")
 
+    delimiter = _sniff_delimiter(file)
+    df = pd.read_csv(file, delimiter=delimiter, nrows=sample_rows)
+    df.columns = df.columns.str.strip().str.lower()
+
+    candidates = _datetime_candidates(df.columns, date_col, index_col, datetime_cols)
+    df, _, _ = _apply_datetime_index(df, candidates)
+    for col in df.columns:
+        try:
+            df[col] = pd.to_numeric(df[col])
+        except Exception:
+            pass
+    return df
+
+
+def _projection(file: Path, delimiter: str, usecols, date_col, index_col, datetime_cols) -> dict:
+    if not usecols:
+        return {}
+    header = pd.read_csv(file, delimiter=delimiter, nrows=0).columns
+    raw_by_name = {}
+    for raw in header:
+        raw_by_name.setdefault(str(raw).strip().lower(), raw)
+
+    wanted = [c.strip().lower() for c in usecols]
+    missing = [c for c in wanted if c not in raw_by_name]
+    if missing:
+        raise ValueError(f"Columns not found in {file.name}: {missing}")
+
+    candidates = _datetime_candidates(list(raw_by_name), date_col, index_col, datetime_cols)
+    keep = set(wanted) | set(candidates)
+    return {'usecols': [raw for name, raw in raw_by_name.items() if name in keep]}
+
+
+def _sniff_delimiter(file: Path) -> str:
     with open(file, 'r', encoding='utf-8', errors='ignore') as f:
         sample = f.read(2048)
         try:
             dialect = csv.Sniffer().sniff(sample)
-            delimiter = dialect.delimiter
+            return dialect.delimiter
         except csv.Error:
-            delimiter = ','
+            return ','
 
-    df = pd.read_csv(file, delimiter=delimiter)
-    df.columns = df.columns.str.strip().str.lower()
 
+def _datetime_candidates(columns, date_col=None, index_col=None, datetime_cols=None) -> list[str]:
     if datetime_cols:
-        candidates = [c.lower() for c in datetime_cols if c.lower() in df.columns]
+        candidates = [c.lower() for c in datetime_cols if c.lower() in columns]
     else:
-        candidates = [c for c in df.columns if any(k in c for k in ['date', 'time', 'timestamp', 'datetime'])]
+        candidates = [c for c in columns if any(k in c for k in ['date', 'time', 'timestamp', 'datetime'])]
 
-    if date_col and date_col.lower() in df.columns:
+    if date_col and date_col.lower() in columns:
         candidates = [date_col.lower()]
-    if index_col and index_col.lower() in df.columns:
+    if index_col and index_col.lower() in columns:
         candidates = [index_col.lower()]
+    return candidates
+
+
+def assemble_datetime(frame: pd.DataFrame, columns: list[str], fmt: str = None):
+    joined = frame[columns[0]].astype(str)
+    for col in columns[1:]:
+        joined = joined.str.cat(frame[col].astype(str), sep=' ')
+
+    if fmt is None:
+        fmt = _infer_datetime_format(joined)
+
+    if fmt is not None:
+        parsed = pd.to_datetime(joined, format=fmt, errors='coerce')
+    else:
+        parsed = pd.Series(pd.NaT, index=joined.index, dtype='datetime64[ns]')
+
+    failed = parsed.isna()
+    fallback_rows = int(failed.sum())
+    if fallback_rows:
+        parsed[failed] = pd.to_datetime(joined[failed].map(_fuzzy_parse), errors='coerce')
 
+    return parsed, fmt, fallback_rows
+
+
+def _infer_datetime_format(joined: pd.Series):
+    sample = joined.dropna().head(_FORMAT_SAMPLE_ROWS)
+    best_fmt, best_hits = None, 0
+    for fmt in dict.fromkeys(guess_datetime_format(v) for v in sample.head(10)):
+        if fmt is None:
+            continue
+        hits = int(pd.to_datetime(sample, format=fmt, errors='coerce').notna().sum())
+        if hits > best_hits:
+            best_fmt, best_hits = fmt, hits
+    return best_fmt
+
+
+def _fuzzy_parse(value):
+    try:
+        return date_parse(value, fuzzy=True)
+    except (ValueError, OverflowError):
+        return pd.NaT
+
+
+def _apply_datetime_index(df: pd.DataFrame, candidates: list[str], fmt: str = None):
+    fallback_rows = 0
     if candidates:
         if len(candidates) == 1:
             col = candidates[0]
             df[col] = pd.to_datetime(df[col], errors='coerce')
             df.set_index(col, inplace=True)
         else:
-            df['__datetime'] = df[candidates].astype(str).agg(' '.join, axis=1)
-            df['__datetime'] = df['__datetime'].apply(lambda x: date_parse(x, fuzzy=True))
+            df['__datetime'], fmt, fallback_rows = assemble_datetime(df, candidates, fmt)
             df.set_index('__datetime', inplace=True)
 
             to_drop = [c for c in candidates if c in df.columns] + ['__datetime']
@@ -53,11 +482,4 @@ def load_csv(
                 df.index = pd.to_datetime(df.index, errors='raise')
             except Exception:
                 pass
-
-    for col in df.columns:
-        try:
-            df[col] = pd.to_numeric(df[col])
-        except Exception:
-            pass
-
-    return df
+    return df, fmt, fallback_rows
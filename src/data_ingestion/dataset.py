@@ -0,0 +1,119 @@
+import glob
+import hashlib
+import json
+from pathlib import Path
+
+import pandas as pd
+
+from src.data_ingestion.cache import DEFAULT_CACHE_DIR, file_fingerprint, load_csv_cached
+from src.data_ingestion.csv_loader import iter_csv_chunks, scan_csv_header, _datetime_candidates, _sniff_delimiter
+
+
+DEFAULT_INDEX_DIR = DEFAULT_CACHE_DIR.parent / 'datasets'
+
+
+class PartitionedDataset:
+    """A time series split across CSV shards; query() opens only the shards overlapping a time range."""
+
+    def __init__(self, source, index_path=None, **load_kwargs):
+        self.source = str(source)
+        self.load_kwargs = load_kwargs
+        if index_path is None:
+            key = json.dumps([self._pattern(), sorted(load_kwargs.items())], default=str)
+            index_path = DEFAULT_INDEX_DIR / f"{hashlib.blake2b(key.encode(), digest_size=16).hexdigest()}.json"
+        self.index_path = Path(index_path)
+        self.shards = []
+
+    def _pattern(self) -> str:
+        source = Path(self.source)
+        return str(source / '*.csv') if source.is_dir() else self.source
+
+    def register(self) -> list[dict]:
+        known = {}
+        if self.index_path.exists():
+            try:
+                known = {s['path']: s for s in json.loads(self.index_path.read_text())['shards']}
+            except (OSError, ValueError, KeyError):
+                known = {}
+
+        shards = []
+        for path in sorted(glob.glob(self._pattern())):
+            fingerprint = file_fingerprint(path)
+            entry = known.get(fingerprint['path'])
+            if entry is None or entry['fingerprint'] != fingerprint:
+                start, end, rows = self._scan_bounds(path)
+                entry = {
+                    'path': fingerprint['path'],
+                    'fingerprint': fingerprint,
+                    'start': None if start is None else start.isoformat(),
+                    'end': None if end is None else end.isoformat(),
+                    'rows': rows,
+                }
+            shards.append(entry)
+
+        self.shards = shards
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        self.index_path.write_text(json.dumps({'source': self.source, 'shards': shards}))
+        return shards
+
+    def columns(self) -> list[str]:
+        if not self.shards:
+            return []
+        return scan_csv_header(self.shards[0]['path'], **self._datetime_kwargs()).columns.tolist()
+
+    def time_bounds(self):
+        starts = [pd.Timestamp(s['start']) for s in self.shards if s['start']]
+        ends = [pd.Timestamp(s['end']) for s in self.shards if s['end']]
+        if not starts:
+            return None, None
+        return min(starts), max(ends)
+
+    def shards_for(self, start=None, end=None) -> list[str]:
+        start = None if start is None else pd.Timestamp(start)
+        end = None if end is None else pd.Timestamp(end)
+        selected = []
+        for shard in self.shards:
+            if shard['start'] is None:
+                continue
+            if end is not None and pd.Timestamp(shard['start']) > end:
+                continue
+            if start is not None and pd.Timestamp(shard['end']) < start:
+                continue
+            selected.append(shard['path'])
+        return selected
+
+    def query(self, start=None, end=None, cols=None) -> pd.DataFrame:
+        kwargs = dict(self.load_kwargs)
+        if cols:
+            kwargs['usecols'] = list(cols)
+        parts = []
+        for path in self.shards_for(start, end):
+            df = load_csv_cached(path, **kwargs)
+            if not df.index.is_monotonic_increasing:
+                df = df.sort_index()
+            parts.append(df.loc[start:end])
+        if not parts:
+            return pd.DataFrame(columns=list(cols or self.columns()))
+        df = pd.concat(parts) if len(parts) > 1 else parts[0]
+        return df if df.index.is_monotonic_increasing else df.sort_index()
+
+    def _datetime_kwargs(self) -> dict:
+        return {k: v for k, v in self.load_kwargs.items() if k in ('date_col', 'index_col', 'datetime_cols')}
+
+    def _scan_bounds(self, path):
+        kwargs = self._datetime_kwargs()
+        header = pd.read_csv(path, delimiter=_sniff_delimiter(Path(path)), nrows=0).columns.str.strip().str.lower()
+        candidates = _datetime_candidates(header, **kwargs)
+        if not candidates:
+            return None, None, 0
+        start = end = None
+        rows = 0
+        for chunk in iter_csv_chunks(path, usecols=candidates, **kwargs):
+            index = chunk.index
+            rows += len(index)
+            if not isinstance(index, pd.DatetimeIndex) or index.isna().all():
+                continue
+            lo, hi = index.min(), index.max()
+            start = lo if start is None else min(start, lo)
+            end = hi if end is None else max(end, hi)
+        return start, end, rows
@@ -0,0 +1,117 @@
+import multiprocessing as mp
+import os
+import queue
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.data_ingestion.cache import load_csv_cached
+from src.data_ingestion.csv_loader import STREAMING_THRESHOLD_BYTES
+from src.data_ingestion.series_store import SeriesStore
+
+
+CANCEL_SLOTS = 1024
+
+
+class IngestionCancelled(Exception):
+    pass
+
+
+_progress_queue = None
+_cancel_flags = None
+
+
+def _init_worker(progress_queue, cancel_flags):
+    global _progress_queue, _cancel_flags
+    _progress_queue = progress_queue
+    _cancel_flags = cancel_flags
+
+
+def _load_worker(path, usecols, compact=False, batch=0):
+    def report(done, total):
+        if _cancel_flags is not None and _cancel_flags[batch]:
+            raise IngestionCancelled(path)
+        if _progress_queue is not None:
+            _progress_queue.put((path, done, total))
+
+    report(0, 1)
+    if Path(path).stat().st_size > STREAMING_THRESHOLD_BYTES:
+        store = SeriesStore.from_csv(path, usecols=usecols, progress_callback=report)
+        return {'store': str(store.root)}
+
+    df = load_csv_cached(path, usecols=usecols, compact=compact, progress_callback=report)
+    report(1, 1)
+    return {
+        'index': np.asarray(df.index),
+        'index_name': df.index.name,
+        'columns': [str(c) for c in df.columns],
+        'values': [df[c].values for c in df.columns],
+        'attrs': dict(df.attrs),
+    }
+
+
+def frame_from_payload(payload: dict) -> pd.DataFrame:
+    if 'store' in payload:
+        return SeriesStore(payload['store']).frame()
+    index = pd.Index(payload['index'], name=payload['index_name'])
+    df = pd.DataFrame(dict(enumerate(payload['values'])), index=index, copy=False)
+    df.columns = payload['columns']
+    df.attrs.update(payload['attrs'])
+    return df
+
+
+class ParallelLoader:
+    """Parse CSV files in a shared process pool with per-file progress and per-batch cancellation."""
+
+    def __init__(self, max_workers: int = None):
+        ctx = mp.get_context('spawn')
+        self._progress = ctx.Queue()
+        self._cancel_flags = ctx.Array('b', CANCEL_SLOTS, lock=False)
+        self._executor = ProcessPoolExecutor(
+            max_workers=max_workers or max(1, min(8, (os.cpu_count() or 2) - 1)),
+            mp_context=ctx,
+            initializer=_init_worker,
+            initargs=(self._progress, self._cancel_flags),
+        )
+        self._next_batch = 0
+        self._latest = {}
+        self.futures = {}
+
+    def batch(self) -> int:
+        batch = self._next_batch % CANCEL_SLOTS
+        self._next_batch += 1
+        self._cancel_flags[batch] = 0
+        return batch
+
+    def submit(self, path, usecols=None, compact=False, batch=0):
+        future = self._executor.submit(_load_worker, str(path), usecols, compact, batch)
+        self.futures[future] = (str(path), batch)
+        return future
+
+    def poll_progress(self) -> dict:
+        """Latest (done, total) per path of the files still loading."""
+        while True:
+            try:
+                path, done, total = self._progress.get_nowait()
+            except queue.Empty:
+                break
+            self._latest[path] = (done, total)
+        for future in [f for f in self.futures if f.done()]:
+            del self.futures[future]
+        active = {path for path, _ in self.futures.values()}
+        self._latest = {path: progress for path, progress in self._latest.items() if path in active}
+        return dict(self._latest)
+
+    def cancel(self, batch=0):
+        self._cancel_flags[batch] = 1
+        for future, (_, b) in self.futures.items():
+            if b == batch:
+                future.cancel()
+
+    def cancelled(self, batch=0) -> bool:
+        return bool(self._cancel_flags[batch])
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,151 @@
+import hashlib
+import json
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.data_ingestion.cache import DEFAULT_CACHE_DIR, file_fingerprint
+from src.data_ingestion.csv_loader import iter_csv_chunks
+
+
+DEFAULT_STORE_DIR = DEFAULT_CACHE_DIR.parent / 'stores'
+_TIMESTAMPS = 'timestamps.i8'
+_MANIFEST = 'manifest.json'
+
+
+class SeriesStore:
+    """Memory-mapped on-disk series: int64 nanosecond timestamps and one float64 array per column."""
+
+    def __init__(self, root):
+        self.root = Path(root)
+        manifest = json.loads((self.root / _MANIFEST).read_text())
+        self.manifest = manifest
+        self.columns = manifest['columns']
+        self.rows = manifest['rows']
+        self.index_name = manifest.get('index_name')
+        self.is_sorted = manifest.get('sorted', False)
+        self._maps = {}
+
+    def __len__(self):
+        return self.rows
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        return self._map(_TIMESTAMPS, np.int64)
+
+    @property
+    def index(self) -> pd.DatetimeIndex:
+        return pd.DatetimeIndex(self.timestamps.view('datetime64[ns]'), name=self.index_name, copy=False)
+
+    def values(self, col) -> np.ndarray:
+        return self._map(self._column_file(col), np.float64)
+
+    def time_range(self, start=None, end=None) -> tuple[int, int]:
+        """Row positions [i0, i1) covering start <= t <= end. Requires sorted timestamps."""
+        if not self.is_sorted:
+            raise ValueError("Time range lookup requires a store with sorted timestamps")
+        ts = self.timestamps
+        i0 = 0 if start is None else int(np.searchsorted(ts, pd.Timestamp(start).value, side='left'))
+        i1 = self.rows if end is None else int(np.searchsorted(ts, pd.Timestamp(end).value, side='right'))
+        return i0, i1
+
+    def frame(self, cols=None, start=None, end=None) -> pd.DataFrame:
+        cols = self.columns if cols is None else list(cols)
+        i0, i1 = (0, self.rows) if start is None and end is None else self.time_range(start, end)
+        index = self.index[i0:i1]
+        data = {col: self.values(col)[i0:i1] for col in cols}
+        return pd.DataFrame(data, index=index, copy=False)
+
+    def series(self, col, start=None, end=None) -> pd.Series:
+        return self.frame([col], start, end)[col]
+
+    def _column_file(self, col) -> str:
+        try:
+            return f'col_{self.columns.index(col)}.f8'
+        except ValueError:
+            raise KeyError(f"Column not in series store: {col}") from None
+
+    def _map(self, name, dtype):
+        if self.rows == 0:
+            return np.empty(0, dtype=dtype)
+        if name not in self._maps:
+            self._maps[name] = np.memmap(self.root / name, dtype=dtype, mode='r', shape=(self.rows,))
+        return self._maps[name]
+
+    @classmethod
+    def write(cls, root, chunks, extra: dict = None) -> 'SeriesStore':
+        """Build a store from DataFrame chunks with a DatetimeIndex, keeping only numeric columns."""
+        root = Path(root)
+        tmp = root.with_name(root.name + '.tmp')
+        shutil.rmtree(tmp, ignore_errors=True)
+        tmp.mkdir(parents=True)
+
+        columns = None
+        index_name = None
+        rows = 0
+        is_sorted = True
+        last_ts = None
+        handles = []
+        try:
+            for chunk in chunks:
+                if not isinstance(chunk.index, pd.DatetimeIndex):
+                    raise ValueError("Series store requires a datetime index")
+                if columns is None:
+                    columns = [c for c in chunk.columns if pd.api.types.is_numeric_dtype(chunk[c])]
+                    index_name = chunk.index.name
+                    handles = [open(tmp / _TIMESTAMPS, 'wb')]
+                    handles += [open(tmp / f'col_{i}.f8', 'wb') for i in range(len(columns))]
+
+                index = chunk.index.tz_convert(None) if chunk.index.tz is not None else chunk.index
+                ts = np.ascontiguousarray(index.as_unit('ns').asi8)
+                if len(ts):
+                    if is_sorted:
+                        is_sorted = bool(np.all(ts[1:] >= ts[:-1]) and (last_ts is None or ts[0] >= last_ts))
+                    last_ts = ts[-1]
+                ts.tofile(handles[0])
+                for handle, col in zip(handles[1:], columns):
+                    values = pd.to_numeric(chunk[col], errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+                    np.ascontiguousarray(values).tofile(handle)
+                rows += len(chunk)
+        except Exception:
+            for handle in handles:
+                handle.close()
+            shutil.rmtree(tmp, ignore_errors=True)
+            raise
+        for handle in handles:
+            handle.close()
+
+        manifest = {
+            'columns': [str(c) for c in columns or []],
+            'rows': rows,
+            'index_name': index_name,
+            'sorted': is_sorted,
+        }
+        manifest.update(extra or {})
+        (tmp / _MANIFEST).write_text(json.dumps(manifest))
+        shutil.rmtree(root, ignore_errors=True)
+        tmp.rename(root)
+        return cls(root)
+
+    @classmethod
+    def from_frame(cls, root, df: pd.DataFrame) -> 'SeriesStore':
+        return cls.write(root, [df])
+
+    @classmethod
+    def from_csv(cls, path, root=None, **load_kwargs) -> 'SeriesStore':
+        """Open the store for a CSV file, rebuilding it when missing or when the file has changed."""
+        options = {k: v for k, v in sorted(load_kwargs.items()) if k != 'progress_callback'}
+        if root is None:
+            key = json.dumps([str(Path(path).resolve()), options], default=str)
+            root = DEFAULT_STORE_DIR / hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+        root = Path(root)
+
+        fingerprint = file_fingerprint(path)
+        if (root / _MANIFEST).exists():
+            store = cls(root)
+            if store.manifest.get('fingerprint') == fingerprint:
+                return store
+
+        return cls.write(root, iter_csv_chunks(path, **load_kwargs), extra={'fingerprint': fingerprint})
@@ -0,0 +1,162 @@
+import io
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.data_ingestion.csv_loader import (
+    read_csv_frame,
+    _apply_datetime_index,
+    _datetime_candidates,
+    _projection,
+    _sniff_delimiter,
+)
+
+
+class CsvFollower:
+    """Parse a CSV once, then only the complete lines appended to it since the last poll()."""
+
+    def __init__(self, path, date_col=None, index_col=None, datetime_cols=None, usecols=None):
+        self.path = Path(path)
+        if not self.path.exists():
+            raise FileNotFoundError(f"CSV file not found: {path}")
+        self.date_col = date_col
+        self.index_col = index_col
+        self.datetime_cols = datetime_cols
+        self.usecols = usecols
+
+        self.delimiter = _sniff_delimiter(self.path)
+        self.projection = _projection(self.path, self.delimiter, usecols, date_col, index_col, datetime_cols)
+        with open(self.path, 'rb') as f:
+            self._header = f.readline()
+        self.offset = len(self._header)
+        header = [c.strip().lower() for c in pd.read_csv(io.BytesIO(self._header), delimiter=self.delimiter, nrows=0).columns]
+        self.has_timestamps = bool(_datetime_candidates(header, date_col, index_col, datetime_cols))
+        self.rows = 0
+        self.last_timestamp = None
+        self.columns = None
+        self._datetime_format = None
+
+    def load(self) -> pd.DataFrame:
+        end = max(self.offset, self._last_line_end(self.path.stat().st_size))
+        with open(self.path, 'rb', buffering=0) as f:
+            # Parse exactly the complete lines up to end, so the offset is where parsing stopped.
+            source = io.BufferedReader(_BoundedReader(f, end))
+            df = read_csv_frame(source, self.delimiter, self.projection, self.date_col, self.index_col, self.datetime_cols)
+        self.offset = end
+        self.columns = df.columns.tolist()
+        self.rows = len(df)
+        self._remember_last(df)
+        return df
+
+    def poll(self) -> pd.DataFrame | None:
+        """Return the rows appended since the last call, or None if there are none."""
+        size = self.path.stat().st_size
+        if size < self.offset:
+            self.offset = len(self._header)
+        if size == self.offset:
+            return None
+
+        with open(self.path, 'rb') as f:
+            f.seek(self.offset)
+            data = f.read(size - self.offset)
+        end = data.rfind(b'\n')
+        if end < 0:
+            return None
+        data = data[:end + 1]
+        self.offset += len(data)
+
+        chunk = pd.read_csv(io.BytesIO(self._header + data), delimiter=self.delimiter, **self.projection)
+        chunk.columns = chunk.columns.str.strip().str.lower()
+        candidates = _datetime_candidates(chunk.columns, self.date_col, self.index_col, self.datetime_cols)
+        chunk, self._datetime_format, _ = _apply_datetime_index(chunk, candidates, self._datetime_format)
+        for col in chunk.columns:
+            chunk[col] = pd.to_numeric(chunk[col], errors='coerce')
+        if self.columns is not None:
+            chunk = chunk.reindex(columns=self.columns)
+
+        if not self.has_timestamps:
+            # Same positional index load_csv gives such a file, continued past the rows read so far.
+            chunk.index = pd.to_datetime(pd.RangeIndex(self.rows, self.rows + len(chunk)))
+        elif self.last_timestamp is not None and isinstance(chunk.index, pd.DatetimeIndex):
+            chunk = chunk[chunk.index > self.last_timestamp]
+        if chunk.empty:
+            return None
+        self.rows += len(chunk)
+        self._remember_last(chunk)
+        return chunk
+
+    def _remember_last(self, df: pd.DataFrame):
+        if self.has_timestamps and isinstance(df.index, pd.DatetimeIndex) and len(df.index):
+            last = df.index.max()
+            if pd.notna(last) and (self.last_timestamp is None or last > self.last_timestamp):
+                self.last_timestamp = last
+
+    def _last_line_end(self, size) -> int:
+        if size == 0:
+            return 0
+        with open(self.path, 'rb') as f:
+            f.seek(max(0, size - 65536))
+            tail = f.read(size - f.tell())
+        end = tail.rfind(b'\n')
+        return size - len(tail) + end + 1 if end >= 0 else size
+
+
+class _BoundedReader(io.RawIOBase):
+    def __init__(self, raw, end):
+        self.raw = raw
+        self.end = end
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        n = min(len(buffer), self.end - self.raw.tell())
+        return self.raw.readinto(memoryview(buffer)[:n]) if n > 0 else 0
+
+
+class AppendBuffer:
+    """Growable float64 column buffers with a datetime index; frame() returns views."""
+
+    def __init__(self, df: pd.DataFrame, capacity: int = None):
+        self.columns = df.columns.tolist()
+        self.index_name = df.index.name
+        self.rows = 0
+        capacity = max(capacity or 0, 2 * len(df), 1024)
+        self._timestamps = np.empty(capacity, dtype=np.int64)
+        self._values = {col: np.empty(capacity, dtype=np.float64) for col in self.columns}
+        self.append(df)
+
+    def append(self, df: pd.DataFrame):
+        n = len(df)
+        if n == 0:
+            return
+        self._reserve(self.rows + n)
+        index = pd.DatetimeIndex(df.index)
+        if index.tz is not None:
+            index = index.tz_convert(None)
+        self._timestamps[self.rows:self.rows + n] = index.as_unit('ns').asi8
+        for col in self.columns:
+            values = pd.to_numeric(df[col], errors='coerce') if col in df.columns else pd.Series(np.nan, index=df.index)
+            self._values[col][self.rows:self.rows + n] = values.to_numpy(dtype=np.float64, na_value=np.nan)
+        self.rows += n
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes reserved by the buffers, including capacity not yet filled."""
+        return self._timestamps.nbytes + sum(values.nbytes for values in self._values.values())
+
+    def frame(self) -> pd.DataFrame:
+        index = pd.DatetimeIndex(self._timestamps[:self.rows].view('datetime64[ns]'), name=self.index_name, copy=False)
+        data = {col: self._values[col][:self.rows] for col in self.columns}
+        return pd.DataFrame(data, index=index, copy=False)
+
+    def _reserve(self, needed):
+        capacity = len(self._timestamps)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        self._timestamps = np.resize(self._timestamps, capacity)
+        for col in self.columns:
+            self._values[col] = np.resize(self._values[col], capacity)
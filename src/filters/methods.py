@@ -1,5 +1,5 @@
 import pandas as pd
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 from statsmodels.tsa.filters.hp_filter import hpfilter
 
 
@@ -25,7 +25,8 @@ def plot_hp_filter(data, lamb=1600, figsize=(10, 6)):
 
 
 def build_hp_filter_figure(orig, trend, cycle, lamb=1600, figsize=(10, 6)):
-    fig, axes = plt.subplots(2, 1, figsize=figsize, sharex=True)
+    fig = Figure(figsize=figsize)
+    axes = fig.subplots(2, 1, sharex=True)
     axes[0].plot(orig.index, orig.iloc[:, 0].values, label='Original', color='steelblue')
     axes[0].plot(trend.index, trend.iloc[:, 0].values, label='Trend', color='orange')
     axes[0].set_title(f'HP Filter (lambda={lamb})')
@@ -35,6 +36,6 @@ def build_hp_filter_figure(orig, trend, cycle, lamb=1600, figsize=(10, 6)):
     axes[1].set_title('Cycle')
     axes[1].legend()
     axes[1].grid(True, alpha=0.3)
-    plt.tight_layout()
+    fig.tight_layout()
     return fig
 
@@ -4,6 +4,8 @@ from statsmodels.tsa.statespace.sarimax import SARIMAX
 from statsmodels.tsa.holtwinters import ExponentialSmoothing
 from prophet import Prophet
 
+from src.analysis.correlation import seasonal_period_candidates
+
 
 def arima_forecast(data, order=(1, 0, 1), steps=30):
 
@@ -99,6 +101,12 @@ def sarimax_forecast_with_ci(data, order=(1, 0, 1), seasonal_order=(0, 0, 0, 0),
     if inferred_freq:
         series = series.asfreq(inferred_freq)
 
+    if seasonal_order[3] is None:
+        period = _detected_period(series)
+        if period == 0 and any(seasonal_order[:3]):
+            raise ValueError("No seasonal period detected; set the seasonal period (m) explicitly.")
+        seasonal_order = (*seasonal_order[:3], period)
+
     model = SARIMAX(series, order=order, seasonal_order=seasonal_order, exog=exog, enforce_stationarity=False, enforce_invertibility=False)
     fitted = model.fit(disp=False)
     forecast_obj = fitted.get_forecast(steps=steps, exog=None)
@@ -134,6 +142,9 @@ def holt_winters_forecast(data, steps=30, seasonal_periods=None, trend='add', se
     if inferred_freq:
         series = series.asfreq(inferred_freq)
 
+    if seasonal is not None and seasonal_periods is None:
+        seasonal_periods = _detected_period(series) or None
+
     model = ExponentialSmoothing(series, trend=trend, seasonal=seasonal, seasonal_periods=seasonal_periods)
     fitted = model.fit()
     forecast_series = fitted.forecast(steps)
@@ -169,4 +180,9 @@ def prophet_forecast(data, periods=30, freq=None):
     combined_df = pd.concat([series.to_frame(name=series_name), forecast_series.to_frame()], axis=1)
     if not series.empty:
         combined_df.loc[series.index[-1], 'Forecast'] = series.iloc[-1]
-    return combined_df
\ No newline at end of file
+    return combined_df
+
+
+def _detected_period(series) -> int:
+    candidates = seasonal_period_candidates(series, max_candidates=1)
+    return candidates[0][0] if candidates else 0
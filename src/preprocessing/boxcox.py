@@ -0,0 +1,134 @@
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+
+from src.preprocessing.series import coerce_series, wrap_series
+
+
+BOXCOX_SAMPLE_ROWS = 100_000
+BOXCOX_LAMBDA_TOL = 0.01
+BOXCOX_STRATA = 64
+BOXCOX_CHUNK_ROWS = 1 << 20
+BOXCOX_FIT_CACHE_SIZE = 32
+
+_FITS = OrderedDict()
+
+
+def estimate_boxcox_lambda(values, shift=0.0, sample_rows=BOXCOX_SAMPLE_ROWS, tol=BOXCOX_LAMBDA_TOL, strata=BOXCOX_STRATA, seed=0) -> tuple[float, int]:
+    """Box-Cox MLE lambda for values + shift from growing stratified subsamples; returns (lambda, rows used)."""
+    x = np.asarray(values, dtype=np.float64)
+    if not np.isfinite(x).all():
+        x = x[np.isfinite(x)]
+    n = len(x)
+    if n == 0:
+        raise ValueError("No valid numeric data for Box-Cox")
+    rng = np.random.default_rng(seed)
+    size = max(int(sample_rows), strata)
+    while 2 * size < n:
+        a = _boxcox_mle(x[_stratified_positions(n, size, strata, rng)] + shift)
+        b = _boxcox_mle(x[_stratified_positions(n, size, strata, rng)] + shift)
+        if abs(a - b) <= tol:
+            return float((a + b) / 2), 2 * size
+        size *= 4
+    return float(_boxcox_mle(x + shift)), n
+
+
+class BoxCoxTransform:
+    """Box-Cox transform with a fixed lambda and shift, fitted once per input and applied in chunks."""
+
+    def __init__(self, lmbda=None, shift=None, sample_rows=BOXCOX_SAMPLE_ROWS, tol=BOXCOX_LAMBDA_TOL, chunk_rows=BOXCOX_CHUNK_ROWS):
+        self.lmbda = None if lmbda is None else float(lmbda)
+        self.shift = None if shift is None else float(shift)
+        self.sample_rows = sample_rows
+        self.tol = tol
+        self.chunk_rows = chunk_rows
+        self.fit_rows = None
+
+    @property
+    def fitted(self) -> bool:
+        return self.lmbda is not None
+
+    def fit(self, data) -> 'BoxCoxTransform':
+        values, _, _ = coerce_series(data, 'Box-Cox')
+        finite = values[np.isfinite(values)]
+        if len(finite) == 0:
+            raise ValueError("No valid numeric data for Box-Cox")
+        if self.shift is None:
+            min_val = finite.min()
+            self.shift = float(1 - min_val) if min_val <= 0 else 0.0
+        if self.lmbda is not None:
+            return self
+
+        key = (hashlib.blake2b(finite.view(np.uint8), digest_size=16).hexdigest(), self.shift, self.sample_rows, self.tol)
+        fit = _FITS.get(key)
+        if fit is None:
+            fit = estimate_boxcox_lambda(finite, shift=self.shift, sample_rows=self.sample_rows, tol=self.tol)
+            _FITS[key] = fit
+            while len(_FITS) > BOXCOX_FIT_CACHE_SIZE:
+                _FITS.popitem(last=False)
+        else:
+            _FITS.move_to_end(key)
+        self.lmbda, self.fit_rows = fit
+        return self
+
+    def transform(self, data):
+        from scipy.special import boxcox as boxcox_apply
+
+        self._check_fitted()
+        values, index, name = coerce_series(data, 'Box-Cox')
+        out = np.empty_like(values)
+        for start in range(0, len(values), self.chunk_rows):
+            chunk = out[start:start + self.chunk_rows]
+            np.add(values[start:start + self.chunk_rows], self.shift, out=chunk)
+            boxcox_apply(chunk, self.lmbda, out=chunk)
+        label = f"BoxCox[{self.lmbda:.3f}]({'value' if name is None else name}{'' if self.shift == 0 else f'+{self.shift:.4g}'})"
+        return wrap_series(data, out, index, label)
+
+    def fit_transform(self, data):
+        return self.fit(data).transform(data)
+
+    def inverse(self, data):
+        from scipy.special import inv_boxcox
+
+        self._check_fitted()
+        values, index, name = coerce_series(data, 'Box-Cox')
+        out = np.empty_like(values)
+        for start in range(0, len(values), self.chunk_rows):
+            chunk = out[start:start + self.chunk_rows]
+            inv_boxcox(values[start:start + self.chunk_rows], self.lmbda, out=chunk)
+            chunk -= self.shift
+        return wrap_series(data, out, index, name)
+
+    def _check_fitted(self):
+        if self.lmbda is None:
+            raise ValueError("Fit the Box-Cox transform before applying it")
+
+
+def _boxcox_mle(x):
+    """Maximize the Box-Cox profile log-likelihood, with log(x) computed once for all evaluations."""
+    from scipy import optimize
+
+    logx = np.log(x)
+    n, total = len(x), logx.sum()
+    scratch = np.empty_like(logx)
+
+    def neg_llf(lmbda):
+        if lmbda == 0:
+            y = logx
+        else:
+            y = np.multiply(logx, lmbda, out=scratch)
+            np.expm1(y, out=y)
+            y /= lmbda
+        with np.errstate(over='ignore', invalid='ignore', divide='ignore'):
+            llf = (lmbda - 1) * total - n / 2 * np.log(y.var())
+        return -llf if np.isfinite(llf) else np.inf
+
+    return optimize.brent(neg_llf, brack=(-2.0, 2.0))
+
+
+def _stratified_positions(n, size, strata, rng):
+    edges = np.linspace(0, n, strata + 1).astype(np.int64)
+    widths = np.diff(edges)
+    per = -(-size // strata)
+    return (edges[:-1, None] + (rng.random((strata, per)) * widths[:, None]).astype(np.int64)).ravel()
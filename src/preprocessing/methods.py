@@ -1,6 +1,19 @@
 import pandas as pd
 import numpy as np
 
+from src.preprocessing.boxcox import BoxCoxTransform, BOXCOX_SAMPLE_ROWS
+
+
+def numeric_matrix(data: pd.DataFrame) -> np.ndarray:
+    return data.apply(pd.to_numeric, errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def window_means(values: np.ndarray, window: int) -> np.ndarray:
+    frame = pd.DataFrame(values.reshape(len(values), -1), copy=False)
+    means = frame.rolling(window).mean().to_numpy()
+    return means.reshape(values.shape)
+
+
 def rolling_mean(data, window=5):
     return data.rolling(window).mean()
 
@@ -13,7 +26,7 @@ def ewma(data, span=12):
 
     if isinstance(data, pd.DataFrame):
         if data.shape[1] != 1:
-            raise ValueError("EWMA expects a single series")
+            return pd.DataFrame(_ewma_matrix(numeric_matrix(data), span), index=data.index, columns=data.columns)
         series = pd.to_numeric(data.iloc[:, 0], errors='coerce')
         result = series.ewm(span=span, adjust=False).mean()
         return result.to_frame(name=data.columns[0])
@@ -22,6 +35,16 @@ def ewma(data, span=12):
         return series.ewm(span=span, adjust=False).mean()
 
 
+def _ewma_matrix(values, span):
+    if len(values) == 0 or np.isnan(values).any():
+        return pd.DataFrame(values).ewm(span=span, adjust=False).mean().to_numpy()
+    from scipy.signal import lfilter
+
+    alpha = 2.0 / (span + 1.0)
+    out, _ = lfilter([alpha], [1.0, alpha - 1.0], values, axis=0, zi=(1.0 - alpha) * values[:1])
+    return out
+
+
 def log_transform(data):
 
     if isinstance(data, pd.DataFrame):
@@ -41,9 +64,7 @@ def log_transform(data):
         return transformed, float(offset)
 
 
-def boxcox_transform(data):
-
-    from scipy.stats import boxcox as scipy_boxcox
+def boxcox_transform(data, sample_rows=BOXCOX_SAMPLE_ROWS):
 
     if isinstance(data, pd.DataFrame):
         if data.shape[1] != 1:
@@ -58,40 +79,33 @@ def boxcox_transform(data):
     if series_clean.empty:
         raise ValueError("No valid numeric data for Box-Cox")
 
-    min_val = series_clean.min()
-    shift = 1 - min_val if pd.notna(min_val) and min_val <= 0 else 0.0
-    shifted = series_clean + shift
-
-    transformed_values, lmbda = scipy_boxcox(shifted)
-    transformed = pd.Series(
-        transformed_values,
-        index=series_clean.index,
-        name=f"BoxCox[{lmbda:.3f}]({series_name}{'' if shift == 0 else f'+{shift:.4g}'})",
-    )
+    fitted = BoxCoxTransform(sample_rows=sample_rows).fit(series_clean)
+    transformed = fitted.transform(series_clean.rename(series_name))
 
-    return transformed.to_frame(name=transformed.name), float(lmbda), float(shift)
+    return transformed.to_frame(name=transformed.name), fitted.lmbda, fitted.shift
 
 
 def boxcox_inverse(transformed, lmbda, shift=0.0):
 
-    from scipy.special import inv_boxcox as scipy_inv_boxcox
-
+    fitted = BoxCoxTransform(lmbda=lmbda, shift=shift)
     if isinstance(transformed, pd.DataFrame):
         if transformed.shape[1] != 1:
             raise ValueError("Inverse Box-Cox expects a single series")
-        series = pd.to_numeric(transformed.iloc[:, 0], errors='coerce')
-        inv = pd.Series(scipy_inv_boxcox(series, lmbda) - shift, index=series.index, name=transformed.columns[0])
-        return inv.to_frame(name=inv.name)
+        return fitted.inverse(transformed)
     else:
-        series = pd.to_numeric(pd.Series(transformed), errors='coerce')
-        return pd.Series(scipy_inv_boxcox(series, lmbda) - shift, index=series.index, name=getattr(series, 'name', None))
+        return fitted.inverse(pd.to_numeric(pd.Series(transformed), errors='coerce'))
 
 
 def standard_scale(data):
 
     if isinstance(data, pd.DataFrame):
         if data.shape[1] != 1:
-            raise ValueError("Standard scale expects a single series")
+            values = numeric_matrix(data)
+            std = np.nanstd(values, axis=0)
+            std[std == 0] = 1
+            values -= np.nanmean(values, axis=0)
+            values /= std
+            return pd.DataFrame(values, index=data.index, columns=[f"Z({c})" for c in data.columns])
         series = pd.to_numeric(data.iloc[:, 0], errors='coerce')
         mean = series.mean()
         std = series.std(ddof=0)
@@ -109,7 +123,14 @@ def minmax_scale(data, feature_range=(0.0, 1.0)):
     a, b = feature_range
     if isinstance(data, pd.DataFrame):
         if data.shape[1] != 1:
-            raise ValueError("MinMax scale expects a single series")
+            values = numeric_matrix(data)
+            min_v, max_v = np.nanmin(values, axis=0), np.nanmax(values, axis=0)
+            denom = max_v - min_v
+            denom[denom == 0] = 1
+            values -= min_v
+            values *= (b - a) / denom
+            values += a
+            return pd.DataFrame(values, index=data.index, columns=[f"MinMax({c})" for c in data.columns])
         series = pd.to_numeric(data.iloc[:, 0], errors='coerce')
         min_v, max_v = series.min(), series.max()
         denom = (max_v - min_v) if max_v != min_v else 1
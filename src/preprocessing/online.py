@@ -0,0 +1,238 @@
+from abc import ABC, abstractmethod
+
+import numpy as np
+import pandas as pd
+
+from src.preprocessing.methods import numeric_matrix, window_means
+
+
+class OnlineTransform(ABC):
+    """Base for transforms that update() on appended rows and can be snapshot() and restored."""
+
+    kind = None
+
+    def __init__(self):
+        self.columns = None
+
+    def update(self, data):
+        values, wrap = _as_matrix(data)
+        if self.columns is None:
+            self.columns = values.shape[1]
+            self._init_state(self.columns)
+        elif values.shape[1] != self.columns:
+            raise ValueError(f"Expected {self.columns} column(s), got {values.shape[1]}")
+        if len(values) == 0:
+            return wrap(values)
+        return wrap(self._update(values))
+
+    def snapshot(self) -> dict:
+        state = {name: (value.copy() if isinstance(value, np.ndarray) else value) for name, value in self._state().items()}
+        return {'kind': self.kind, 'params': self._params(), 'columns': self.columns, 'state': state}
+
+    @classmethod
+    def from_snapshot(cls, snapshot: dict) -> 'OnlineTransform':
+        transform = cls(**snapshot['params'])
+        transform.columns = snapshot['columns']
+        for name, value in snapshot['state'].items():
+            setattr(transform, name, value.copy() if isinstance(value, np.ndarray) else value)
+        return transform
+
+    @abstractmethod
+    def _init_state(self, columns):
+        ...
+
+    @abstractmethod
+    def _update(self, values):
+        ...
+
+    @abstractmethod
+    def _params(self) -> dict:
+        ...
+
+    @abstractmethod
+    def _state(self) -> dict:
+        ...
+
+
+class OnlineRollingMean(OnlineTransform):
+    """Rolling mean over a ring buffer of the last window rows; matches rolling(window).mean()."""
+
+    kind = 'rolling_mean'
+
+    def __init__(self, window=5):
+        super().__init__()
+        if window < 1:
+            raise ValueError("Rolling window must be at least 1")
+        self.window = int(window)
+
+    def _init_state(self, columns):
+        self._buffer = np.full((self.window, columns), np.nan)
+        self._pos = 0
+        self._seen = 0
+
+    def _update(self, values):
+        w = self.window
+        k = min(self._seen, w - 1)
+        history = np.roll(self._buffer, -self._pos, axis=0)[w - k:]
+        extended = np.concatenate([history, values])
+        out = window_means(extended, w)[k:]
+
+        n = len(values)
+        tail = values[-w:]
+        positions = (self._pos + n - len(tail) + np.arange(len(tail))) % w
+        self._buffer[positions] = tail
+        self._pos = (self._pos + n) % w
+        self._seen += n
+        return out
+
+    def _params(self):
+        return {'window': self.window}
+
+    def _state(self):
+        return {'_buffer': self._buffer, '_pos': self._pos, '_seen': self._seen}
+
+
+class OnlineEWMA(OnlineTransform):
+    """Carried EWMA state; matches ewm(span, adjust=False).mean() including NaN gaps."""
+
+    kind = 'ewma'
+
+    def __init__(self, span=12):
+        super().__init__()
+        self.span = span
+        self.alpha = 2.0 / (span + 1.0)
+
+    def _init_state(self, columns):
+        self._weighted = np.full(columns, np.nan)
+        self._old_wt = np.ones(columns)
+
+    def _update(self, values):
+        out = np.empty_like(values)
+        a = self.alpha
+        n = len(values)
+        i = 0
+        # The filter below assumes a fully started state right after an observed row.
+        while i < n and (np.isnan(self._weighted).any() or (self._old_wt != 1).any() or np.isnan(values[i]).any()):
+            self._step(values[i])
+            out[i] = self._weighted
+            i += 1
+        if i < n and not np.isnan(values[i:]).any():
+            from scipy.signal import lfilter
+
+            out[i:], _ = lfilter([a], [1.0, a - 1.0], values[i:], axis=0, zi=((1.0 - a) * self._weighted)[None, :])
+            self._weighted = out[n - 1].copy()
+            self._old_wt[:] = 1.0
+        else:
+            for j in range(i, n):
+                self._step(values[j])
+                out[j] = self._weighted
+        return out
+
+    def _step(self, row):
+        observed = ~np.isnan(row)
+        started = ~np.isnan(self._weighted)
+        self._old_wt = np.where(started, self._old_wt * (1.0 - self.alpha), self._old_wt)
+        update = started & observed
+        with np.errstate(invalid='ignore'):
+            blended = (self._old_wt * self._weighted + self.alpha * row) / (self._old_wt + self.alpha)
+        self._weighted = np.where(update, blended, np.where(~started & observed, row, self._weighted))
+        self._old_wt = np.where(update, 1.0, self._old_wt)
+
+    def _params(self):
+        return {'span': self.span}
+
+    def _state(self):
+        return {'_weighted': self._weighted, '_old_wt': self._old_wt}
+
+
+class OnlineStandardScaler(OnlineTransform):
+    """Welford running mean/variance; new rows are scaled with the statistics including them."""
+
+    kind = 'standard_scale'
+
+    def _init_state(self, columns):
+        self.count = np.zeros(columns)
+        self.mean = np.zeros(columns)
+        self._m2 = np.zeros(columns)
+
+    def _update(self, values):
+        observed = ~np.isnan(values)
+        n_b = observed.sum(axis=0).astype(np.float64)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean_b = np.where(n_b > 0, np.nansum(values, axis=0) / n_b, 0.0)
+            m2_b = np.nansum((values - mean_b) ** 2, axis=0)
+            total = self.count + n_b
+            delta = mean_b - self.mean
+            safe = np.where(total > 0, total, 1.0)
+            self.mean = self.mean + delta * n_b / safe
+            self._m2 = self._m2 + m2_b + delta ** 2 * self.count * n_b / safe
+        self.count = total
+        out = values - self.mean
+        out /= self.std
+        return out
+
+    @property
+    def std(self) -> np.ndarray:
+        with np.errstate(invalid='ignore', divide='ignore'):
+            std = np.sqrt(np.where(self.count > 0, self._m2 / np.where(self.count > 0, self.count, 1.0), 0.0))
+        return np.where(std == 0, 1.0, std)
+
+    def _params(self):
+        return {}
+
+    def _state(self):
+        return {'count': self.count, 'mean': self.mean, '_m2': self._m2}
+
+
+class OnlineMinMaxScaler(OnlineTransform):
+    """Running min/max; new rows are scaled with the range seen so far including them."""
+
+    kind = 'minmax_scale'
+
+    def __init__(self, feature_range=(0.0, 1.0)):
+        super().__init__()
+        self.feature_range = tuple(feature_range)
+
+    def _init_state(self, columns):
+        self.min = np.full(columns, np.nan)
+        self.max = np.full(columns, np.nan)
+
+    def _update(self, values):
+        a, b = self.feature_range
+        with np.errstate(invalid='ignore'):
+            self.min = np.fmin(self.min, np.fmin.reduce(values, axis=0))
+            self.max = np.fmax(self.max, np.fmax.reduce(values, axis=0))
+        denom = self.max - self.min
+        denom = np.where((denom == 0) | np.isnan(denom), 1.0, denom)
+        out = values - self.min
+        out *= (b - a) / denom
+        out += a
+        return out
+
+    def _params(self):
+        return {'feature_range': self.feature_range}
+
+    def _state(self):
+        return {'min': self.min, 'max': self.max}
+
+
+ONLINE_TRANSFORMS = {
+    cls.kind: cls for cls in (OnlineRollingMean, OnlineEWMA, OnlineStandardScaler, OnlineMinMaxScaler)
+}
+
+
+def restore_transform(snapshot: dict) -> OnlineTransform:
+    return ONLINE_TRANSFORMS[snapshot['kind']].from_snapshot(snapshot)
+
+
+def _as_matrix(data):
+    if isinstance(data, pd.DataFrame):
+        values = numeric_matrix(data)
+        return values, lambda out: pd.DataFrame(out, index=data.index, columns=data.columns)
+    if isinstance(data, pd.Series):
+        values = pd.to_numeric(data, errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)[:, None]
+        return values, lambda out: pd.Series(out[:, 0], index=data.index, name=data.name)
+    values = np.asarray(data, dtype=np.float64)
+    if values.ndim == 1:
+        return values[:, None], lambda out: out[:, 0]
+    return values, lambda out: out
@@ -0,0 +1,260 @@
+import ast
+import re
+import threading
+
+import numpy as np
+import pandas as pd
+
+from src.data_ingestion.cache import frame_fingerprint
+from src.preprocessing.boxcox import estimate_boxcox_lambda
+from src.preprocessing.methods import window_means
+from src.preprocessing.series import coerce_series, wrap_series
+
+
+_PARAM_TOKEN = re.compile(r'[^\s=()]+=\([^)]*\)|\S+')
+
+
+def _log_forward(values, params):
+    finite = values[np.isfinite(values)]
+    min_val = finite.min() if len(finite) else np.nan
+    offset = float(1 - min_val) if not np.isnan(min_val) and min_val <= 0 else 0.0
+    out = values + offset
+    np.log(out, out=out)
+    return out, {'offset': offset}
+
+
+def _log_inverse(values, state):
+    out = np.exp(values)
+    out -= state['offset']
+    return out
+
+
+def _boxcox_forward(values, params):
+    from scipy.special import boxcox as boxcox_apply
+
+    finite = np.isfinite(values)
+    if not finite.any():
+        raise ValueError("No valid numeric data for Box-Cox")
+    min_val = values[finite].min()
+    shift = float(1 - min_val) if min_val <= 0 else 0.0
+    out = values + shift
+    lmbda = params.get('lmbda')
+    if lmbda is None:
+        lmbda, _ = estimate_boxcox_lambda(out[finite])
+    boxcox_apply(out, lmbda, out=out)
+    return out, {'lmbda': float(lmbda), 'shift': shift}
+
+
+def _boxcox_inverse(values, state):
+    from scipy.special import inv_boxcox as scipy_inv_boxcox
+
+    out = scipy_inv_boxcox(values, state['lmbda'])
+    out -= state['shift']
+    return out
+
+
+def _diff_forward(values, params):
+    periods = int(params.get('periods', 1))
+    if periods < 1:
+        raise ValueError("Differencing periods must be at least 1")
+    out = np.empty_like(values)
+    out[:periods] = np.nan
+    np.subtract(values[periods:], values[:-periods], out=out[periods:])
+    return out, {'periods': periods, 'head': values[:periods].copy()}
+
+
+def _diff_inverse(values, state):
+    periods, head = state['periods'], state['head']
+    out = np.empty_like(values)
+    out[:periods] = head
+    for r in range(min(periods, len(values))):
+        np.cumsum(values[r + periods::periods], out=out[r + periods::periods])
+        out[r + periods::periods] += head[r]
+    return out
+
+
+def _rolling_mean_forward(values, params):
+    window = int(params.get('window', 5))
+    if window < 1:
+        raise ValueError("Rolling window must be at least 1")
+    return window_means(values, window), {}
+
+
+def _ewma_forward(values, params):
+    span = float(params.get('span', 12))
+    alpha = 2.0 / (span + 1.0)
+    if len(values) == 0:
+        return values.copy(), {'alpha': alpha}
+    if np.isnan(values).any():
+        out = pd.Series(values).ewm(span=span, adjust=False).mean().to_numpy()
+    else:
+        from scipy.signal import lfilter
+        out, _ = lfilter([alpha], [1.0, alpha - 1.0], values, zi=[(1.0 - alpha) * values[0]])
+    return out, {'alpha': alpha}
+
+
+def _ewma_inverse(values, state):
+    alpha = state['alpha']
+    out = np.empty_like(values)
+    if len(values):
+        out[0] = values[0]
+        np.subtract(values[1:], (1.0 - alpha) * values[:-1], out=out[1:])
+        out[1:] /= alpha
+        starts = np.isnan(values[:-1])
+        out[1:][starts] = values[1:][starts]
+    return out
+
+
+def _zscale_forward(values, params):
+    mean = float(np.nanmean(values))
+    std = float(np.nanstd(values))
+    std = std if std != 0 else 1.0
+    out = values - mean
+    out /= std
+    return out, {'mean': mean, 'std': std}
+
+
+def _zscale_inverse(values, state):
+    out = values * state['std']
+    out += state['mean']
+    return out
+
+
+def _minmax_forward(values, params):
+    a, b = params.get('feature_range', (0.0, 1.0))
+    min_v, max_v = float(np.nanmin(values)), float(np.nanmax(values))
+    denom = (max_v - min_v) if max_v != min_v else 1.0
+    out = values - min_v
+    out *= (b - a) / denom
+    out += a
+    return out, {'min': min_v, 'denom': denom, 'range': (a, b)}
+
+
+def _minmax_inverse(values, state):
+    a, b = state['range']
+    out = values - a
+    out *= state['denom'] / (b - a)
+    out += state['min']
+    return out
+
+
+PIPELINE_STEPS = {
+    'log': (_log_forward, _log_inverse),
+    'boxcox': (_boxcox_forward, _boxcox_inverse),
+    'diff': (_diff_forward, _diff_inverse),
+    'rolling_mean': (_rolling_mean_forward, None),
+    'ewma': (_ewma_forward, _ewma_inverse),
+    'zscale': (_zscale_forward, _zscale_inverse),
+    'minmax': (_minmax_forward, _minmax_inverse),
+}
+
+
+class PreprocessingPipeline:
+    """Chain of preprocessing steps whose per-stage outputs and fitted states are memoized, with inverse()."""
+
+    def __init__(self, steps=()):
+        self.steps = []
+        self._source = None
+        self._stages = []
+        self._lock = threading.Lock()
+        for name, params in steps:
+            self.add(name, **params)
+
+    def add(self, name, **params) -> 'PreprocessingPipeline':
+        if name not in PIPELINE_STEPS:
+            raise ValueError(f"Unknown preprocessing step: {name}")
+        self.steps.append((name, params))
+        return self
+
+    def set_params(self, position, **params):
+        name, current = self.steps[position]
+        self.steps[position] = (name, {**current, **params})
+
+    def describe(self) -> str:
+        """The steps in the text form parse_pipeline() reads."""
+        return ' | '.join(
+            ' '.join([name] + [f"{k}={v}" for k, v in sorted(params.items())])
+            for name, params in self.steps
+        )
+
+    def run(self, data, steps=None):
+        """Run the steps over data, first replacing them with steps if given; safe to call from several threads."""
+        values, index, name = coerce_series(data, 'Pipeline')
+        name = 'value' if name is None else name
+        fingerprint = frame_fingerprint(pd.Series(values, index=index))
+        with self._lock:
+            if steps is not None:
+                self.steps = list(steps)
+            return wrap_series(data, self._run(values, fingerprint).copy(), index, self._label(name))
+
+    def _run(self, values, fingerprint):
+        if self._source != fingerprint:
+            self._source = fingerprint
+            self._stages = []
+
+        for position, (step, params) in enumerate(self.steps):
+            key = (step, tuple(sorted(params.items())))
+            if position < len(self._stages) and self._stages[position][0] == key:
+                values = self._stages[position][1]
+                continue
+            del self._stages[position:]
+            forward, _ = PIPELINE_STEPS[step]
+            values, state = forward(values, params)
+            self._stages.append((key, values, state))
+        del self._stages[len(self.steps):]
+        return values
+
+    def _label(self, name):
+        for step, _ in self.steps:
+            name = f"{step}({name})"
+        return name
+
+    def inverse(self, data):
+        """Map values in the pipeline's output space back to the input space."""
+        values, index, name = coerce_series(data, 'Pipeline')
+        name = 'value' if name is None else name
+        with self._lock:
+            if len(self._stages) != len(self.steps):
+                raise ValueError("Run the pipeline before inverting it")
+            for (step, _), (_, _, state) in zip(reversed(self.steps), reversed(self._stages)):
+                _, inverse = PIPELINE_STEPS[step]
+                if inverse is None:
+                    raise ValueError(f"Step '{step}' is not invertible")
+                values = inverse(values, state)
+        return wrap_series(data, values, index, name)
+
+    def states(self) -> list[dict]:
+        with self._lock:
+            return [
+                {name: (value.copy() if isinstance(value, np.ndarray) else value) for name, value in state.items()}
+                for _, _, state in self._stages
+            ]
+
+
+def parse_pipeline(spec: str) -> PreprocessingPipeline:
+    """Build a pipeline from text such as 'log | diff periods=1 | rolling_mean window=5 | minmax feature_range=(-1, 1)'."""
+    pipeline = PreprocessingPipeline()
+    for part in spec.split('|'):
+        tokens = _PARAM_TOKEN.findall(part)
+        if not tokens:
+            continue
+        params = {}
+        for token in tokens[1:]:
+            key, sep, value = token.partition('=')
+            if not sep:
+                raise ValueError(f"Expected key=value, got '{token}'")
+            params[key] = _parse_value(value)
+        pipeline.add(tokens[0], **params)
+    return pipeline
+
+
+def _parse_value(text):
+    try:
+        value = ast.literal_eval(text)
+    except (ValueError, SyntaxError):
+        raise ValueError(f"Expected a number or a tuple of numbers, got '{text}'") from None
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, (tuple, list)) and all(isinstance(v, (int, float)) for v in value):
+        return tuple(value)
+    raise ValueError(f"Expected a number or a tuple of numbers, got '{text}'")
@@ -0,0 +1,25 @@
+import numpy as np
+import pandas as pd
+
+
+def coerce_series(data, what='This transform'):
+    """A single series (DataFrame column, Series or array) as float64 values, its index and its name."""
+    if isinstance(data, pd.DataFrame):
+        if data.shape[1] != 1:
+            raise ValueError(f"{what} expects a single series")
+        series, name = data.iloc[:, 0], data.columns[0]
+    elif isinstance(data, pd.Series):
+        series, name = data, data.name
+    else:
+        series, name = pd.Series(np.asarray(data)), None
+    values = pd.to_numeric(series, errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+    return values, series.index, name
+
+
+def wrap_series(data, values, index, name):
+    """values in the same container type as data."""
+    if isinstance(data, pd.DataFrame):
+        return pd.DataFrame({name: values}, index=index)
+    if isinstance(data, pd.Series):
+        return pd.Series(values, index=index, name=name)
+    return values
@@ -0,0 +1,88 @@
+import atexit
+import multiprocessing as mp
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pandas as pd
+
+from src.preprocessing.methods import rolling_mean, differencing, ewma, standard_scale, minmax_scale
+from src.anomaly_detection.methods import zscore_anomalies
+
+
+VECTORIZED_METHODS = {rolling_mean, differencing, ewma, standard_scale, minmax_scale, zscore_anomalies}
+
+_POOLS = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def shared_executor(use_processes: bool = True, max_workers: int = None):
+    """Module-wide worker pool, created on first use and shut down at exit."""
+    workers = max_workers or max(1, (os.cpu_count() or 2) - 1)
+    key = (use_processes, workers)
+    with _POOLS_LOCK:
+        executor = _POOLS.get(key)
+        if executor is None or getattr(executor, '_broken', False):
+            if use_processes:
+                executor = ProcessPoolExecutor(max_workers=workers, mp_context=mp.get_context('spawn'))
+            else:
+                executor = ThreadPoolExecutor(max_workers=workers)
+            _POOLS[key] = executor
+    return executor
+
+
+@atexit.register
+def _shutdown_pools():
+    with _POOLS_LOCK:
+        for executor in _POOLS.values():
+            executor.shutdown(wait=False, cancel_futures=True)
+        _POOLS.clear()
+
+
+def _run_column(fn, column, frame, kwargs):
+    try:
+        return column, fn(frame, **kwargs), None
+    except Exception as e:
+        return column, None, f"{type(e).__name__}: {e}"
+
+
+def map_columns(fn, data: pd.DataFrame, max_workers: int = None, use_processes: bool = True, executor=None, **kwargs) -> tuple[dict, dict]:
+    """Run a single-series method on every column in a worker pool; returns results and errors per column."""
+    if executor is None:
+        executor = shared_executor(use_processes, max_workers)
+    results, errors = {}, {}
+    futures = [executor.submit(_run_column, fn, c, data[[c]], kwargs) for c in data.columns]
+    for future in futures:
+        column, result, error = future.result()
+        if error is None:
+            results[column] = result
+        else:
+            errors[column] = error
+    return results, errors
+
+
+def combine_results(results: dict):
+    """Merge per-column results into one frame, Series or tuple aligned on the source columns."""
+    if not results:
+        return pd.DataFrame()
+    first = next(iter(results.values()))
+    if isinstance(first, tuple):
+        return tuple(combine_results({c: r[i] for c, r in results.items()}) for i in range(len(first)))
+    if isinstance(first, pd.DataFrame):
+        if all(r.shape[1] == 1 for r in results.values()):
+            return pd.concat([r.iloc[:, 0].rename(c) for c, r in results.items()], axis=1)
+        return pd.concat(results, axis=1)
+    if isinstance(first, pd.Series):
+        return pd.concat([r.rename(c) for c, r in results.items()], axis=1)
+    return pd.Series(results)
+
+
+def batch_apply(fn, data, max_workers: int = None, use_processes: bool = True, errors: str = 'raise', executor=None, **kwargs):
+    """Apply a single-series method to every column, natively for VECTORIZED_METHODS; errors='skip' drops failing columns."""
+    if not isinstance(data, pd.DataFrame) or data.shape[1] == 1 or fn in VECTORIZED_METHODS:
+        return fn(data, **kwargs)
+    results, failed = map_columns(fn, data, max_workers=max_workers, use_processes=use_processes, executor=executor, **kwargs)
+    if failed and errors == 'raise':
+        details = '; '.join(f"{c}: {e}" for c, e in failed.items())
+        raise ValueError(f"{fn.__name__} failed for {len(failed)} column(s): {details}")
+    return combine_results(results)
@@ -0,0 +1,239 @@
+import functools
+import hashlib
+import json
+import os
+import pickle
+import sys
+import threading
+import types
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.data_ingestion.cache import frame_fingerprint
+
+
+DEFAULT_RESULT_BYTES = 512 * 1024 ** 2
+DEFAULT_SPILL_BYTES = 2 * 1024 ** 3
+RESULT_WALK_DEPTH = 4
+OBJECT_OVERHEAD_BYTES = 512
+UNKNOWN_RESULT_BYTES = 1024 ** 2
+_FORMAT_VERSION = 1
+
+
+def result_key(method: str, data, params: dict, version: str = '') -> str:
+    """Cache key from the method name and version, a content hash of the input and normalized params."""
+    payload = json.dumps([_FORMAT_VERSION, version, method, frame_fingerprint(data), _normalize(params)], sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+def result_nbytes(value, _seen=None, _depth=0) -> int:
+    """Approximate in-memory size of a method result, walking model attributes up to RESULT_WALK_DEPTH."""
+    seen = set() if _seen is None else _seen
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        usage = value.memory_usage(index=True, deep=True)
+        return int(usage.sum() if isinstance(usage, pd.Series) else usage)
+    if isinstance(value, pd.Index):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if isinstance(value, (str, bytes)):
+        return len(value)
+    if isinstance(value, (int, float, bool, complex, np.generic)) or value is None:
+        return 8
+    if isinstance(value, (tuple, list, set, frozenset)):
+        return sum(result_nbytes(v, seen, _depth) for v in value)
+    if isinstance(value, dict):
+        return sum(result_nbytes(v, seen, _depth) for v in value.values())
+    if isinstance(value, (type, types.ModuleType, types.FunctionType, types.MethodType)):
+        return 0
+    if _depth >= RESULT_WALK_DEPTH:
+        return 0
+    attributes = getattr(value, '__dict__', None)
+    if attributes is None:
+        return UNKNOWN_RESULT_BYTES
+    return OBJECT_OVERHEAD_BYTES + sum(result_nbytes(v, seen, _depth + 1) for v in list(attributes.values()))
+
+
+class ResultCache:
+    """Thread-safe LRU of method results keyed by (method, input content, params), optionally spilling to disk."""
+
+    def __init__(self, max_bytes: int = DEFAULT_RESULT_BYTES, spill_dir=None, spill_max_bytes: int = DEFAULT_SPILL_BYTES):
+        self.max_bytes = max_bytes
+        self.spill_dir = Path(spill_dir) if spill_dir is not None else None
+        self.spill_max_bytes = spill_max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._tags = {}
+        self._lock = threading.Lock()
+
+    def call(self, fn, data, method: str = None, tag=None, **params):
+        """fn(data, **params), served from the cache when data and params were seen before."""
+        key = result_key(method or f"{fn.__module__}.{fn.__qualname__}", data, params, version=_code_version(fn))
+        found, value = self.lookup(key)
+        if not found:
+            value = fn(data, **params)
+            self.put(key, value)
+        if tag is not None:
+            with self._lock:
+                if key in self._entries:
+                    self._tags.setdefault(tag, set()).add(key)
+        return _copy_result(value)
+
+    def lookup(self, key) -> tuple[bool, object]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, entry[0]
+        value = self._read_spill(key)
+        if value is None:
+            with self._lock:
+                self.misses += 1
+            return False, None
+        self.put(key, value[0])
+        with self._lock:
+            self.hits += 1
+        return True, value[0]
+
+    def put(self, key, value):
+        size = result_nbytes(value)
+        evicted = []
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._entries[key] = (value, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes and len(self._entries) > 1:
+                old_key, (old_value, old_size) = self._entries.popitem(last=False)
+                self._bytes -= old_size
+                self._untag(old_key)
+                evicted.append((old_key, old_value))
+        for old_key, old_value in evicted:
+            self._spill(old_key, old_value)
+
+    def nbytes(self, tag=None) -> int:
+        """Resident bytes of all entries, or of the entries requested under tag."""
+        with self._lock:
+            if tag is None:
+                return self._bytes
+            return sum(self._entries[k][1] for k in self._tags.get(tag, ()) if k in self._entries)
+
+    def drop_tag(self, tag):
+        with self._lock:
+            self._tags.pop(tag, None)
+
+    def __contains__(self, key):
+        with self._lock:
+            if key in self._entries:
+                return True
+        return self.spill_dir is not None and self._spill_path(key).exists()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._tags.clear()
+            self._bytes = 0
+        if self.spill_dir is not None and self.spill_dir.exists():
+            for path in self.spill_dir.glob('*.pkl'):
+                path.unlink(missing_ok=True)
+
+    def _untag(self, key):
+        for tag in [t for t, keys in self._tags.items() if key in keys]:
+            keys = self._tags[tag]
+            keys.discard(key)
+            if not keys:
+                del self._tags[tag]
+
+    def _spill_path(self, key) -> Path:
+        return self.spill_dir / f"{key}.pkl"
+
+    def _spill(self, key, value):
+        if self.spill_dir is None:
+            return
+        try:
+            self.spill_dir.mkdir(parents=True, exist_ok=True)
+            path = self._spill_path(key)
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp.replace(path)
+            self._evict_spill()
+        except (OSError, pickle.PicklingError, TypeError, AttributeError):
+            pass
+
+    def _read_spill(self, key):
+        if self.spill_dir is None:
+            return None
+        path = self._spill_path(key)
+        try:
+            with open(path, 'rb') as f:
+                value = pickle.load(f)
+            os.utime(path)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return None
+        return (value,)
+
+    def _evict_spill(self):
+        files = []
+        for path in self.spill_dir.glob('*.pkl'):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.spill_max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+
+@functools.lru_cache(maxsize=None)
+def _source_digest(path: str) -> str:
+    try:
+        return hashlib.blake2b(Path(path).read_bytes(), digest_size=8).hexdigest()
+    except OSError:
+        return ''
+
+
+def _code_version(fn) -> str:
+    path = getattr(sys.modules.get(getattr(fn, '__module__', None)), '__file__', None)
+    return _source_digest(path) if path else ''
+
+
+def _copy_result(value):
+    if isinstance(value, (pd.DataFrame, pd.Series, np.ndarray)):
+        return value.copy()
+    if isinstance(value, tuple):
+        return tuple(_copy_result(v) for v in value)
+    if isinstance(value, list):
+        return [_copy_result(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _copy_result(v) for k, v in value.items()}
+    return value
+
+
+def _normalize(value):
+    if isinstance(value, dict):
+        return {str(k): _normalize(v) for k, v in sorted(value.items(), key=lambda item: str(item[0]))}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return frame_fingerprint(value)
+    return value
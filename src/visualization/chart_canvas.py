@@ -1,13 +1,27 @@
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QTableWidget, QTableWidgetItem
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QSplitter
+from PyQt6.QtCore import QTimer
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
+import matplotlib.dates as mdates
+from matplotlib.collections import FillBetweenPolyCollection, PathCollection
+from matplotlib.lines import Line2D
 import pandas as pd
 import numpy as np
+from src.visualization.decimation import minmax_decimate, minmax_positions, density_voxels, visible_slice, POINTS_PER_PIXEL
+from src.visualization.table_model import DataTableView
+from src.visualization.pyramid import column_values
+from src.visualization.line_style import style_line_axes, style_legend, BACKGROUND_COLOR, LINE_FIGSIZE
+
+_NS_PER_DAY = 86400 * 10 ** 9
+FRAME_INTERVAL_MS = 16
+INTERACTION_IDLE_MS = 150
+SCATTER_3D_MAX_POINTS = 2000
+DENSITY_3D_BINS = (48, 24, 24)
 
 
 class ChartCanvas(FigureCanvas):
     def __init__(self, parent=None):
-        self.fig = Figure(figsize=(12, 6), facecolor='#1e1e1e')
+        self.fig = Figure(figsize=LINE_FIGSIZE, facecolor=BACKGROUND_COLOR)
         self.ax = None
         self._current_projection = None
         super().__init__(self.fig)
@@ -15,30 +29,65 @@ class ChartCanvas(FigureCanvas):
 
         self._dragging = False
         self._last_mouse_pos = None
+        self._lines = []
+        self._tails = {}
+        self._frame = None
+        self._artists = {}
+        self._x_kind = None
+        self.persistent_artists = True
+        self._epoch_ns = pd.Timestamp(mdates.get_epoch()).value
+        self.pyramids = {}
+
+        self._pending_xlim = None
+        self._background = None
+        self._animated = []
+        self._frame_timer = QTimer(self)
+        self._frame_timer.setSingleShot(True)
+        self._frame_timer.setInterval(FRAME_INTERVAL_MS)
+        self._frame_timer.timeout.connect(self._render_frame)
+        self._idle_timer = QTimer(self)
+        self._idle_timer.setSingleShot(True)
+        self._idle_timer.setInterval(INTERACTION_IDLE_MS)
+        self._idle_timer.timeout.connect(self._end_interaction)
 
         self.mpl_connect('scroll_event', self._on_scroll)
         self.mpl_connect('button_press_event', self._on_press)
         self.mpl_connect('motion_notify_event', self._on_motion)
         self.mpl_connect('button_release_event', self._on_release)
+        self.mpl_connect('resize_event', lambda event: self._drop_background())
 
     def plot_data(self, df: pd.DataFrame, cols=None, ci_lower: pd.Series | None = None, ci_upper: pd.Series | None = None):
-        self.fig.clf()
-        self.ax = self.fig.add_subplot(111)
-        self._current_projection = None
+        self._reset_interaction()
+        x_kind = _index_kind(df.index)
+        reuse = (
+            self.persistent_artists and self.ax is not None
+            and self.ax.name == 'rectilinear' and x_kind == self._x_kind
+        )
+        if not reuse:
+            self.fig.clf()
+            self.ax = self.fig.add_subplot(111)
+            self._current_projection = None
+            self._artists = {}
+            self._x_kind = x_kind
+        self._lines = []
+        self._tails = {}
+        self._frame = df
 
         if cols is None:
             cols = df.columns.tolist()
 
+        stale = self._artists
+        artists = {}
         for col in cols:
             if col in df.columns:
                 data = df[col]
-                if len(data.dropna()) > 0:
+                if data.notna().any():
                     if col == 'Forecast':
-                        self.ax.plot(data.index, data.values, label=col, color='yellow', linewidth=2)
+                        artists[col] = self._plot_line(data, stale.get(col), label=col, color='yellow', linewidth=2)
                     elif col == 'Anomaly':
-                        self.ax.scatter(data.index, data.values, label=col, color='red', marker='x', zorder=3)
+                        artists[col] = self._plot_scatter(data, stale.get(col), label=col, color='red', marker='x', zorder=3)
                     else:
-                        self.ax.plot(data.index, data.values, label=col)
+                        artists[col] = self._plot_line(data, stale.get(col), label=col)
 
         if ci_lower is not None and ci_upper is not None:
             try:
@@ -48,74 +97,229 @@ class ChartCanvas(FigureCanvas):
                 ci_l = ci_l.loc[common_index]
                 ci_u = ci_u.loc[common_index]
                 if len(common_index) > 0:
-                    self.ax.fill_between(common_index, ci_l.values, ci_u.values, color='yellow', alpha=0.15, label='95% CI')
+                    artists['95% CI'] = self._plot_fill(common_index, ci_l.values, ci_u.values, stale.get('95% CI'))
             except Exception:
                 pass
 
-        self._format_axes()
-        self.draw()
+        for label, artist in stale.items():
+            if artists.get(label) is not artist:
+                artist.remove()
+        self._artists = artists
 
+        if not reuse:
+            self._format_axes()
+            self.draw()
+            return
+
+        self._autoscale()
+        if list(artists) != list(stale):
+            style_legend(self.ax)
+        self.draw_idle()
+
+    def extend_data(self, previous: pd.DataFrame, df: pd.DataFrame, cols=None):
+        cols = df.columns.tolist() if cols is None else cols
+        start = len(previous)
+        positions = {line.get_label(): k for k, (line, *_) in enumerate(self._lines)}
+        if (
+            previous is not self._frame or self.ax is None or len(df) <= start
+            or not isinstance(df.index, pd.DatetimeIndex) or set(positions) != set(cols)
+            or any(self._lines[k][0] not in self._tails for k in positions.values())
+        ):
+            self.plot_data(df, cols)
+            return
+        x = df.index.asi8
+        if start and x[start] < x[start - 1]:
+            self.plot_data(df, cols)
+            return
+
+        self._frame = df
+        full_view = self.ax.get_autoscalex_on() and self._background is None
+        for col, k in positions.items():
+            line = self._lines[k][0]
+            y = np.asarray(column_values(df[col]), dtype=np.float64)
+            self._lines[k] = (line, x, y, True, None)
+            if full_view:
+                xd, yd = self._extend_tail(line, x, y)
+                line.set_data(self._to_plot_x(xd, True), yd)
+        if full_view:
+            self._autoscale()
+            self.draw_idle()
+        elif self._background is None:
+            lo, hi = self.ax.get_xlim()
+            if self._from_plot_x(lo, True) <= x[-1] and x[start] <= self._from_plot_x(hi, True):
+                self._refresh_decimation()
+                self.draw_idle()
+
+    def _remember_tail(self, line, x, xd, yd, width):
+        # Decimated points before the last bucket are final; rows from tail_start on are redone on append.
+        tail_start = int(np.searchsorted(x, x[-1] - width, side='left')) if len(x) else 0
+        self._tails[line] = (xd, yd, tail_start, width)
+
+    def _extend_tail(self, line, x, y):
+        xd, yd, tail_start, width = self._tails[line]
+        tail_x, tail_y = x[tail_start:], y[tail_start:]
+        buckets = max(1, int(np.ceil((tail_x[-1] - tail_x[0]) / width))) if width > 0 else 1
+        new_x, new_y = minmax_decimate(tail_x, tail_y, buckets)
+        keep = int(np.searchsorted(xd, tail_x[0], side='left'))
+        xd = np.concatenate([xd[:keep], new_x])
+        yd = np.concatenate([yd[:keep], new_y])
+        budget = self._pixel_buckets()
+        if len(xd) > 4 * budget:
+            xd, yd = minmax_decimate(xd, yd, budget)
+            width = (x[-1] - x[0]) / budget
+        self._remember_tail(line, x, xd, yd, width)
+        return xd, yd
+
+    def _plot_line(self, data: pd.Series, line=None, **kwargs):
+        index = data.index
+        if isinstance(index, pd.DatetimeIndex):
+            x, is_datetime = index.asi8, True
+        elif pd.api.types.is_numeric_dtype(index):
+            x, is_datetime = np.asarray(index, dtype=np.float64), False
+        else:
+            x = None
+        if x is None or not index.is_monotonic_increasing or not pd.api.types.is_numeric_dtype(data):
+            line, = self.ax.plot(index, data.values, **kwargs)
+            return line
+
+        pyramid = self.pyramids.get(kwargs.get('label'))
+        if pyramid is not None and not pyramid.matches(x, column_values(data)):
+            pyramid = None
+        buckets = self._pixel_buckets()
+        if pyramid is not None:
+            y = pyramid.y
+            xd, yd = pyramid.query(x[0], x[-1], buckets)
+        else:
+            y = data.to_numpy(dtype=np.float64, na_value=np.nan)
+            xd, yd = minmax_decimate(x, y, buckets)
+        if isinstance(line, Line2D):
+            line.set_data(self._to_plot_x(xd, is_datetime), yd)
+        else:
+            line, = self.ax.plot(self._to_plot_x(xd, is_datetime), yd, **kwargs)
+            if is_datetime:
+                self.ax.xaxis_date()
+        self._lines.append((line, x, y, is_datetime, pyramid))
+        self._remember_tail(line, x, xd, yd, (x[-1] - x[0]) / buckets if len(x) else 0)
+        return line
+
+    def _plot_scatter(self, data: pd.Series, collection=None, **kwargs):
+        index = data.index
+        if isinstance(collection, PathCollection) and isinstance(index, pd.DatetimeIndex):
+            x = self._to_plot_x(index.asi8, True)
+            y = pd.to_numeric(data, errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+            collection.set_offsets(np.column_stack([x, y]))
+            return collection
+        return self.ax.scatter(index, data.values, **kwargs)
+
+    def _plot_fill(self, index, lower, upper, collection=None):
+        if isinstance(collection, FillBetweenPolyCollection):
+            collection.set_data(index, lower, upper)
+            return collection
+        return self.ax.fill_between(index, lower, upper, color='yellow', alpha=0.15, label='95% CI')
+
+    def _autoscale(self):
+        self.ax.relim()
+        for collection in self.ax.collections:
+            bounds = collection.get_datalim(self.ax.transData).get_points()
+            if np.isfinite(bounds).all():
+                self.ax.update_datalim(bounds)
+        self.ax.set_autoscale_on(True)
+        self.ax.autoscale_view()
+
+    def _pixel_buckets(self):
+        return max(1, int(self.width() * POINTS_PER_PIXEL / 2))
+
+    def _to_plot_x(self, x, is_datetime):
+        return (x - self._epoch_ns) / _NS_PER_DAY if is_datetime else x
+
+    def _from_plot_x(self, value, is_datetime):
+        return value * _NS_PER_DAY + self._epoch_ns if is_datetime else value
+
+    def _refresh_decimation(self):
+        if self.ax is None or not self._lines:
+            return
+        lo, hi = self.ax.get_xlim()
+        buckets = self._pixel_buckets()
+        for line, x, y, is_datetime, pyramid in self._lines:
+            left, right = self._from_plot_x(lo, is_datetime), self._from_plot_x(hi, is_datetime)
+            if pyramid is not None:
+                xd, yd = pyramid.query(left, right, buckets)
+            else:
+                i0, i1 = visible_slice(x, left, right)
+                xd, yd = minmax_decimate(x[i0:i1], y[i0:i1], buckets)
+            line.set_data(self._to_plot_x(xd, is_datetime), yd)
 
     def plot_table(self, df: pd.DataFrame):
+        self._reset_interaction()
         self.fig.clf()
         self.ax = None
+        self._lines = []
+        self._tails = {}
+        self._frame = None
+        self._artists = {}
 
-        table = QTableWidget()
-        rows, cols = df.shape
-        table.setRowCount(rows)
-        table.setColumnCount(cols)
-        table.setHorizontalHeaderLabels([str(c) for c in df.columns])
-        table.setVerticalHeaderLabels([str(i) for i in df.index])
-
-        for i in range(rows):
-            for j in range(cols):
-                table.setItem(i, j, QTableWidgetItem(str(df.iat[i, j])))
+        table = getattr(self, '_table', None)
+        if table is not None:
+            table.set_frame(df)
+            table.show()
+            return table
 
         parent = self.parent()
-        layout = QVBoxLayout(parent)
-        layout.addWidget(table)
-        parent.setLayout(layout)
+        table = DataTableView(df)
+        if isinstance(parent, QSplitter):
+            parent.addWidget(table)
+        else:
+            layout = parent.layout() or QVBoxLayout(parent)
+            layout.addWidget(table)
+        self._table = table
+        return table
 
     def plot_3d_data(self, df, col1, col2):
         try:
+            self._reset_interaction()
             self.fig.clf()
             self.ax = self.fig.add_subplot(111, projection='3d')
             self._current_projection = '3d'
+            self._lines = []
+            self._tails = {}
+            self._frame = None
+            self._artists = {}
 
-            if not isinstance(df.index, pd.DatetimeIndex):
-                df.index = pd.to_datetime(df.index)
+            index = df.index if isinstance(df.index, pd.DatetimeIndex) else pd.to_datetime(df.index)
 
             data1 = pd.to_numeric(df[col1], errors='coerce')
             data2 = pd.to_numeric(df[col2], errors='coerce')
-            times = df.index.astype(np.int64) // 10 ** 9
+            times = index.asi8 // 10 ** 9
 
-            mask = ~(data1.isna() | data2.isna())
-            times = times[mask]
-            data1 = data1[mask].to_numpy()
-            data2 = data2[mask].to_numpy()
+            data1 = data1.to_numpy(dtype=np.float64)
+            data2 = data2.to_numpy(dtype=np.float64)
+            mask = np.isfinite(data1) & np.isfinite(data2)
+            if not mask.all():
+                times, data1, data2 = times[mask], data1[mask], data2[mask]
 
             if len(times) == 0:
                 print("No valid data points for 3D plot")
                 return
 
-            max_points = 2000
-            if len(times) > max_points:
-                step = len(times) // max_points
-                times = times[::step]
-                data1 = data1[::step]
-                data2 = data2[::step]
-
-            time_range = times.max() - times.min()
-            if time_range == 0:
-                norm_times = np.zeros_like(times, dtype=float)
+            if len(times) > SCATTER_3D_MAX_POINTS:
+                if np.any(times[1:] < times[:-1]):
+                    order = np.argsort(times, kind='stable')
+                    times, data1, data2 = times[order], data1[order], data2[order]
+                scatter = self._plot_3d_density(times, data1, data2)
+                colorbar_label = 'Points per cell (log)'
             else:
-                norm_times = (times - times.min()) / time_range
-
-            scatter = self.ax.scatter(times, data1, data2,
-                                      c=norm_times,
-                                      cmap='plasma',
-                                      alpha=0.8,
-                                      s=50)
+                time_range = times.max() - times.min()
+                if time_range == 0:
+                    norm_times = np.zeros_like(times, dtype=float)
+                else:
+                    norm_times = (times - times.min()) / time_range
+
+                scatter = self.ax.scatter(times, data1, data2,
+                                          c=norm_times,
+                                          cmap='plasma',
+                                          alpha=0.8,
+                                          s=50)
+                colorbar_label = 'Time Progress'
 
             self.ax.set_xlabel('Time', fontsize=10, labelpad=10)
             self.ax.set_ylabel(col1, fontsize=10, labelpad=10)
@@ -127,7 +331,7 @@ class ChartCanvas(FigureCanvas):
             self.ax.set_xticklabels([pd.Timestamp(t * 10 ** 9).strftime('%Y-%m-%d')
                                      for t in times[tick_indices]], rotation=45)
 
-            cbar = self.fig.colorbar(scatter, label='Time Progress')
+            cbar = self.fig.colorbar(scatter, label=colorbar_label)
             cbar.ax.yaxis.label.set_color('white')
             cbar.ax.tick_params(colors='white')
 
@@ -143,12 +347,27 @@ class ChartCanvas(FigureCanvas):
         self._format_axes()
         self.draw()
 
+    def _plot_3d_density(self, times, data1, data2):
+        (ct, c1, c2), counts = density_voxels([times, data1, data2], DENSITY_3D_BINS)
+        scatter = self.ax.scatter(ct, c1, c2,
+                                  c=np.log1p(counts),
+                                  cmap='plasma',
+                                  alpha=0.6,
+                                  s=12 + 48 * counts / counts.max())
+
+        n_buckets = DENSITY_3D_BINS[0] * 4
+        positions = np.union1d(minmax_positions(times, data1, n_buckets),
+                               minmax_positions(times, data2, n_buckets))
+        self.ax.scatter(times[positions], data1[positions], data2[positions],
+                        color='white', alpha=0.9, s=4, depthshade=False)
+        return scatter
+
     def _format_axes(self):
         if self.ax is None:
             return
 
-        self.ax.set_facecolor('#1e1e1e')
         if self._current_projection == '3d':
+            self.ax.set_facecolor(BACKGROUND_COLOR)
             self.ax.set_title('3D View', color='white')
             self.ax.xaxis.label.set_color('white')
             self.ax.yaxis.label.set_color('white')
@@ -157,24 +376,20 @@ class ChartCanvas(FigureCanvas):
             self.ax.tick_params(colors='white', axis='y')
             self.ax.tick_params(colors='white', axis='z')
         else:
-            self.ax.set_title('Line View', color='white')
-            self.ax.tick_params(colors='white')
-            handles, labels = self.ax.get_legend_handles_labels()
-            if labels:
-                legend = self.ax.legend(facecolor='gray', edgecolor='white', labelcolor='white')
-                legend.get_frame().set_alpha(0.5)
+            style_line_axes(self.ax)
 
     def _on_scroll(self, event):
+        if self.ax is None:
+            return
         base_scale = 1.2
-        cur_xlim = self.ax.get_xlim()
+        cur_xlim = self._pending_xlim or self.ax.get_xlim()
         xdata = event.xdata or 0
         scale_factor = base_scale if event.button == 'up' else 1 / base_scale
         new_width = (cur_xlim[1] - cur_xlim[0]) * scale_factor
         center = xdata
         left = center - new_width * ((center - cur_xlim[0]) / (cur_xlim[1] - cur_xlim[0]))
         right = left + new_width
-        self.ax.set_xlim(left, right)
-        self.draw()
+        self._request_xlim(left, right)
 
     def _on_press(self, event):
         if event.button == 1:
@@ -182,18 +397,82 @@ class ChartCanvas(FigureCanvas):
             self._last_mouse_pos = event.x
 
     def _on_motion(self, event):
-        if self._dragging and event.xdata is not None:
+        if self._dragging and event.xdata is not None and self.ax is not None:
             dx = self._last_mouse_pos - event.x
-            left, right = self.ax.get_xlim()
+            left, right = self._pending_xlim or self.ax.get_xlim()
             scale = (right - left) / self.width()
-            self.ax.set_xlim(left + dx * scale, right + dx * scale)
             self._last_mouse_pos = event.x
-            self.draw()
+            self._request_xlim(left + dx * scale, right + dx * scale)
 
     def _on_release(self, event):
         self._dragging = False
         self._last_mouse_pos = None
+        if self._background is not None:
+            self._idle_timer.start()
+
+    def _request_xlim(self, left, right):
+        self._pending_xlim = (left, right)
+        self._begin_interaction()
+        if not self._frame_timer.isActive():
+            self._frame_timer.start()
+        self._idle_timer.start()
+
+    def _begin_interaction(self):
+        if self._background is not None or self.ax is None or self._current_projection == '3d':
+            return
+        self._animated = list(self.ax.lines) + list(self.ax.collections)
+        for artist in self._animated:
+            artist.set_animated(True)
+        self.draw()
+        self._background = self.copy_from_bbox(self.fig.bbox)
+
+    def _render_frame(self):
+        if self._pending_xlim is None or self.ax is None:
+            return
+        self.ax.set_xlim(*self._pending_xlim)
+        self._pending_xlim = None
+        self._refresh_decimation()
+        if self._background is None:
+            self.draw_idle()
+            return
+        self.restore_region(self._background)
+        for artist in self._animated:
+            self.ax.draw_artist(artist)
+        self.blit(self.fig.bbox)
+
+    def _end_interaction(self):
+        if self._dragging:
+            return
+        if self._pending_xlim is not None:
+            self._frame_timer.stop()
+            self.ax.set_xlim(*self._pending_xlim)
+            self._pending_xlim = None
+            self._refresh_decimation()
+        was_interacting = self._background is not None
+        self._drop_background()
+        if was_interacting:
+            self.draw()
+
+    def _drop_background(self):
+        for artist in self._animated:
+            artist.set_animated(False)
+        self._animated = []
+        self._background = None
+
+    def _reset_interaction(self):
+        self._frame_timer.stop()
+        self._idle_timer.stop()
+        self._pending_xlim = None
+        self._drop_background()
 
     def set_grid(self, show):
         self.ax.grid(show)
-        self.draw()
\ No newline at end of file
+        self.draw()
+
+
+def _index_kind(index) -> str:
+    if isinstance(index, pd.DatetimeIndex):
+        return 'datetime'
+    if pd.api.types.is_numeric_dtype(index):
+        return 'numeric'
+    return 'other'
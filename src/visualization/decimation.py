@@ -0,0 +1,82 @@
+import numpy as np
+
+
+POINTS_PER_PIXEL = 2
+DENSITY_CHUNK_ROWS = 1 << 20
+
+
+def visible_slice(x: np.ndarray, lo, hi) -> tuple[int, int]:
+    """Positions [i0, i1) of sorted x inside [lo, hi], padded by one point on each side."""
+    if np.issubdtype(x.dtype, np.integer):
+        info = np.iinfo(x.dtype)
+        lo, hi = (x.dtype.type(int(min(max(v, info.min), info.max))) for v in (lo, hi))
+    i0 = max(0, int(np.searchsorted(x, lo, side='left')) - 1)
+    i1 = min(len(x), int(np.searchsorted(x, hi, side='right')) + 1)
+    return i0, i1
+
+
+def minmax_decimate(x: np.ndarray, y: np.ndarray, n_buckets: int) -> tuple[np.ndarray, np.ndarray]:
+    """Keep each equal-width x bucket's min and max in time order, so peaks and NaN gaps survive; x must be sorted."""
+    if n_buckets < 1 or len(x) <= 2 * n_buckets:
+        return x, y
+    positions = minmax_positions(x, y, n_buckets)
+    return x[positions], y[positions]
+
+
+def minmax_positions(x: np.ndarray, y: np.ndarray, n_buckets: int) -> np.ndarray:
+    """Sorted positions of the first/last point and each bucket's min and max of y."""
+    n = len(x)
+    edges = np.linspace(float(x[0]), float(x[-1]), n_buckets + 1)[:-1].astype(x.dtype)
+    starts = np.unique(np.searchsorted(x, edges, side='left'))
+    starts = starts[starts < n]
+    ends = np.append(starts[1:], n)
+
+    with np.errstate(invalid='ignore'):
+        mins = np.fmin.reduceat(y, starts)
+        maxs = np.fmax.reduceat(y, starts)
+
+    positions = np.empty(2 * len(starts) + 2, dtype=np.intp)
+    positions[0], positions[1] = 0, n - 1
+    for k in range(len(starts)):
+        s, e = starts[k], ends[k]
+        if np.isnan(mins[k]):
+            positions[2 * k + 2] = positions[2 * k + 3] = s
+            continue
+        segment = y[s:e]
+        positions[2 * k + 2] = s + np.argmax(segment == mins[k])
+        positions[2 * k + 3] = s + np.argmax(segment == maxs[k])
+    return np.unique(positions)
+
+
+def density_voxels(columns: list[np.ndarray], bins: tuple[int, ...],
+                   chunk_rows: int = DENSITY_CHUNK_ROWS) -> tuple[list[np.ndarray], np.ndarray]:
+    """Bin points into an equal-width grid; returns occupied cell centers (one array per column) and counts."""
+    scales = []
+    for values, n in zip(columns, bins):
+        lo, hi = float(values.min()), float(values.max())
+        scales.append((lo, (hi - lo) / n or 1.0))
+
+    rows = len(columns[0])
+    scratch = np.empty(min(rows, chunk_rows), dtype=np.float64)
+    cell = np.empty(len(scratch), dtype=np.intp)
+    flat = np.empty(len(scratch), dtype=np.intp)
+    counts = np.zeros(int(np.prod(bins)), dtype=np.int64)
+    for start in range(0, rows, chunk_rows):
+        stop = min(rows, start + chunk_rows)
+        m = stop - start
+        flat[:m] = 0
+        for values, n, (lo, width) in zip(columns, bins, scales):
+            np.subtract(values[start:stop], lo, out=scratch[:m])
+            scratch[:m] *= 1.0 / width
+            np.minimum(scratch[:m], n - 1, out=scratch[:m])
+            np.copyto(cell[:m], scratch[:m], casting='unsafe')
+            flat[:m] *= n
+            flat[:m] += cell[:m]
+        counts += np.bincount(flat[:m], minlength=len(counts))
+
+    occupied = np.flatnonzero(counts)
+    centers = [
+        lo + (cell + 0.5) * width
+        for cell, (lo, width) in zip(np.unravel_index(occupied, bins), scales)
+    ]
+    return centers, counts[occupied]
@@ -0,0 +1,184 @@
+import argparse
+import multiprocessing as mp
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from matplotlib.figure import Figure
+
+from src.analysis.methods import (
+    plot_distribution,
+    seasonal_decompose,
+    build_seasonal_decomposition_figure,
+    compute_acf_pacf,
+    build_acf_pacf_figure,
+)
+from src.data_ingestion.cache import load_csv_cached
+from src.data_ingestion.csv_loader import scan_csv_header
+from src.filters.methods import hp_filter_decompose, build_hp_filter_figure
+from src.visualization.decimation import minmax_decimate, POINTS_PER_PIXEL
+from src.visualization.line_style import style_line_axes, BACKGROUND_COLOR, LINE_FIGSIZE
+
+
+FIGURE_KINDS = ('line', 'seasonal_decompose', 'acf_pacf', 'hp_filter', 'distribution')
+EXPORT_FORMATS = ('png', 'svg')
+DEFAULT_DPI = 100
+
+
+def build_line_figure(df: pd.DataFrame, cols=None, dpi=DEFAULT_DPI) -> Figure:
+    """The ChartCanvas line view as a standalone figure, decimated to its pixel width."""
+    fig = Figure(figsize=LINE_FIGSIZE, facecolor=BACKGROUND_COLOR, dpi=dpi)
+    ax = fig.add_subplot(111)
+    n_buckets = int(LINE_FIGSIZE[0] * dpi * POINTS_PER_PIXEL / 2)
+    for col in cols or df.columns.tolist():
+        data = df[col]
+        if not data.notna().any():
+            continue
+        kwargs = {'label': col}
+        if col == 'Forecast':
+            kwargs.update(color='yellow', linewidth=2)
+        index = data.index
+        if (isinstance(index, pd.DatetimeIndex) and index.is_monotonic_increasing
+                and pd.api.types.is_numeric_dtype(data)):
+            y = data.to_numpy(dtype=np.float64, na_value=np.nan)
+            x, y = minmax_decimate(index.asi8, y, n_buckets)
+            ax.plot(x.view('M8[ns]'), y, **kwargs)
+        else:
+            ax.plot(index, data.values, **kwargs)
+    style_line_axes(ax)
+    return fig
+
+
+def build_export_figure(df: pd.DataFrame, kind: str, column, params: dict = None, dpi=DEFAULT_DPI):
+    params = params or {}
+    if kind == 'line':
+        return build_line_figure(df, [column] if column else None, dpi=dpi)
+    data = df[[column]]
+    if kind == 'seasonal_decompose':
+        return build_seasonal_decomposition_figure(seasonal_decompose(data, **params))
+    if kind == 'acf_pacf':
+        return build_acf_pacf_figure(compute_acf_pacf(data, lags=params.get('lags', 40)))
+    if kind == 'hp_filter':
+        lamb = params.get('lamb', 1600)
+        orig, trend, cycle = hp_filter_decompose(data, lamb=lamb)
+        return build_hp_filter_figure(orig, trend, cycle, lamb=lamb)
+    if kind == 'distribution':
+        return plot_distribution(data, title_prefix=params.get('title_prefix', 'Distribution'))
+    raise ValueError(f"Unknown figure kind: {kind}")
+
+
+def _init_worker():
+    import matplotlib
+    matplotlib.use('Agg')
+
+
+def _render_series(path, column, figures, dpi):
+    """Load one column once and render every requested figure of it; returns (output, error) pairs."""
+    try:
+        df = load_csv_cached(path, usecols=[column])
+    except Exception as e:
+        return [(output, f"{type(e).__name__}: {e}") for _, _, output, _ in figures]
+
+    rendered = []
+    for kind, params, output, fmt in figures:
+        try:
+            fig = build_export_figure(df, kind, column, params, dpi=dpi)
+            fig.savefig(output, format=fmt, dpi=dpi, facecolor=fig.get_facecolor())
+            rendered.append((output, None))
+        except Exception as e:
+            rendered.append((output, f"{type(e).__name__}: {e}"))
+    return rendered
+
+
+def export_jobs(paths, kinds=('line',), out_dir='.', fmt='png', columns=None, params=None) -> list[dict]:
+    """One job per (file, numeric column, figure kind), written as <stem>_<column>_<kind>.<fmt>."""
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported format: {fmt}")
+    unknown = set(kinds) - set(FIGURE_KINDS)
+    if unknown:
+        raise ValueError(f"Unknown figure kinds: {sorted(unknown)}")
+    out_dir = Path(out_dir)
+    params = params or {}
+    jobs = []
+    for path in paths:
+        if columns:
+            cols = list(columns)
+        else:
+            sample = scan_csv_header(path)
+            cols = [c for c in sample.columns if pd.api.types.is_numeric_dtype(sample[c])]
+        for col in cols:
+            for kind in kinds:
+                jobs.append({
+                    'path': str(path),
+                    'column': col,
+                    'kind': kind,
+                    'params': params.get(kind, {}),
+                    'format': fmt,
+                    'output': str(out_dir / f"{Path(path).stem}_{col}_{kind}.{fmt}"),
+                })
+    return jobs
+
+
+def export_charts(jobs, max_workers: int = None, dpi=DEFAULT_DPI, progress_callback=None) -> dict:
+    """Render export jobs with Agg in a process pool, one worker task per series; returns counts, failures and timing."""
+    grouped = {}
+    for job in jobs:
+        Path(job['output']).parent.mkdir(parents=True, exist_ok=True)
+        grouped.setdefault((job['path'], job['column']), []).append(
+            (job['kind'], job.get('params') or {}, job['output'], job['format'])
+        )
+
+    start = time.perf_counter()
+    done = 0
+    failed = []
+    ctx = mp.get_context('spawn')
+    workers = max_workers or max(1, min(len(grouped), (os.cpu_count() or 2) - 1))
+    with ProcessPoolExecutor(max_workers=max(1, workers), mp_context=ctx, initializer=_init_worker) as executor:
+        futures = [
+            executor.submit(_render_series, path, column, figures, dpi)
+            for (path, column), figures in grouped.items()
+        ]
+        for future in as_completed(futures):
+            for output, error in future.result():
+                done += 1
+                if error is not None:
+                    failed.append((output, error))
+            if progress_callback:
+                progress_callback(done, len(jobs))
+
+    seconds = time.perf_counter() - start
+    figures = done - len(failed)
+    return {
+        'figures': figures,
+        'failed': failed,
+        'seconds': seconds,
+        'figures_per_second': figures / seconds if seconds > 0 else 0.0,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render QLab charts for CSV series without the GUI.")
+    parser.add_argument('paths', nargs='+', help="CSV files to render")
+    parser.add_argument('--out', default='.', help="output directory")
+    parser.add_argument('--kind', action='append', choices=FIGURE_KINDS, help="figure kind (repeatable, default: line)")
+    parser.add_argument('--format', default='png', choices=EXPORT_FORMATS)
+    parser.add_argument('--columns', nargs='+', help="columns to render (default: all numeric columns)")
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--dpi', type=int, default=DEFAULT_DPI)
+    args = parser.parse_args(argv)
+
+    jobs = export_jobs(args.paths, kinds=args.kind or ['line'], out_dir=args.out, fmt=args.format, columns=args.columns)
+    report = export_charts(jobs, max_workers=args.workers, dpi=args.dpi)
+    for output, error in report['failed']:
+        print(f"Failed {output}: {error}", file=sys.stderr)
+    print(f"Rendered {report['figures']} figures in {report['seconds']:.2f}s "
+          f"({report['figures_per_second']:.1f} figures/s)")
+    return 1 if report['failed'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,79 @@
+from collections import OrderedDict
+
+from PyQt6.QtWidgets import QTabWidget
+from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+
+
+FIGURE_CACHE_ENTRIES = 12
+
+
+class FigureCache:
+    """LRU of built figures keyed by (fingerprint, method, params); on_evict(key, figure) runs for each one dropped."""
+
+    def __init__(self, max_entries: int = FIGURE_CACHE_ENTRIES, on_evict=None):
+        self.max_entries = max_entries
+        self.on_evict = on_evict
+        self._figures = OrderedDict()
+
+    @staticmethod
+    def key(fingerprint: str, method: str, params: dict = None) -> tuple:
+        return fingerprint, method, tuple(sorted((params or {}).items()))
+
+    def get(self, key):
+        figure = self._figures.get(key)
+        if figure is not None:
+            self._figures.move_to_end(key)
+        return figure
+
+    def put(self, key, figure):
+        self._figures[key] = figure
+        self._figures.move_to_end(key)
+        while len(self._figures) > self.max_entries:
+            old_key, old_figure = self._figures.popitem(last=False)
+            if self.on_evict:
+                self.on_evict(old_key, old_figure)
+
+    def clear(self):
+        while self._figures:
+            key, figure = self._figures.popitem(last=False)
+            if self.on_evict:
+                self.on_evict(key, figure)
+
+    def __len__(self):
+        return len(self._figures)
+
+    def __contains__(self, key):
+        return key in self._figures
+
+
+class FigurePanel(QTabWidget):
+    """Closable tabs of embedded analysis figures, one canvas per cache key."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setTabsClosable(True)
+        self.tabCloseRequested.connect(lambda i: self.drop(self.widget(i).property('figure_key')))
+        self._canvases = {}
+
+    def show_figure(self, key, title, figure):
+        canvas = self._canvases.get(key)
+        if canvas is None or canvas.figure is not figure:
+            self.drop(key)
+            canvas = FigureCanvas(figure)
+            canvas.setProperty('figure_key', key)
+            self._canvases[key] = canvas
+            self.addTab(canvas, title)
+        self.setCurrentWidget(canvas)
+        self.show()
+
+    def drop(self, key):
+        canvas = self._canvases.pop(key, None)
+        if canvas is None:
+            return
+        self.removeTab(self.indexOf(canvas))
+        canvas.deleteLater()
+        if self.count() == 0:
+            self.hide()
+
+    def __contains__(self, key):
+        return key in self._canvases
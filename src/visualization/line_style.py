@@ -0,0 +1,20 @@
+BACKGROUND_COLOR = '#1e1e1e'
+FOREGROUND_COLOR = 'white'
+LINE_FIGSIZE = (12, 6)
+
+
+def style_line_axes(ax, title='Line View'):
+    """Dark line-view styling shared by ChartCanvas and headless exports."""
+    ax.set_facecolor(BACKGROUND_COLOR)
+    ax.set_title(title, color=FOREGROUND_COLOR)
+    ax.tick_params(colors=FOREGROUND_COLOR)
+    style_legend(ax)
+
+
+def style_legend(ax):
+    handles, labels = ax.get_legend_handles_labels()
+    if labels:
+        legend = ax.legend(facecolor='gray', edgecolor=FOREGROUND_COLOR, labelcolor=FOREGROUND_COLOR)
+        legend.get_frame().set_alpha(0.5)
+    elif ax.get_legend() is not None:
+        ax.get_legend().remove()
@@ -16,14 +16,32 @@ from PyQt6.QtWidgets import (
     QListWidget,
     QListWidgetItem,
     QPushButton,
-    QSpinBox
+    QSpinBox,
+    QProgressBar,
+    QDateTimeEdit,
+    QTableWidget,
+    QTableWidgetItem,
+    QInputDialog
 )
 
 from PyQt6.QtGui import QAction
-from PyQt6.QtCore import Qt, QRunnable, QThreadPool, QObject, pyqtSignal
+from PyQt6.QtCore import Qt, QRunnable, QThreadPool, QObject, QTimer, pyqtSignal
 from pathlib import Path
-from src.data_ingestion.csv_loader import load_csv
+import shutil
+import tempfile
+import numpy as np
+import pandas as pd
+from src.data_ingestion.cache import load_csv_cached, frame_fingerprint
+from src.data_ingestion.csv_loader import scan_csv_header, frame_memory, STREAMING_THRESHOLD_BYTES
+from src.data_ingestion.series_store import SeriesStore
+from src.data_ingestion.tail import CsvFollower, AppendBuffer
+from src.data_ingestion.parallel import ParallelLoader, frame_from_payload
+from src.data_ingestion.dataset import PartitionedDataset
 from src.visualization.chart_canvas import ChartCanvas
+from src.visualization.table_model import DataTableView
+from src.visualization.figure_panel import FigureCache, FigurePanel
+from src.timeseries_methods.result_cache import ResultCache
+from src.visualization.pyramid import series_pyramid, column_values, PYRAMID_MIN_ROWS
 from src.preprocessing.methods import (
     rolling_mean,
     differencing,
@@ -34,15 +52,17 @@ from src.preprocessing.methods import (
     standard_scale,
     minmax_scale,
 )
+from src.preprocessing.pipeline import PreprocessingPipeline, parse_pipeline
 from src.analysis.methods import (
     plot_distribution,
     plot_before_after,
     seasonal_decompose,
     build_seasonal_decomposition_figure,
-    prepare_acf_pacf_data,
+    compute_acf_pacf,
     build_acf_pacf_figure,
     stationarity_tests,
 )
+from src.analysis.correlation import seasonal_period_candidates
 from src.filters.methods import (
     hp_filter_decompose,
     build_hp_filter_figure,
@@ -57,7 +77,8 @@ from src.anomaly_detection.methods import (
     zscore_anomalies,
     isolation_forest_anomalies,
 )
-import matplotlib.pyplot as plt
+FOLLOW_INTERVAL_MS = 1000
+INGEST_POLL_MS = 100
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -73,12 +94,25 @@ class MainWindow(QMainWindow):
         add_series_action.triggered.connect(self.add_series)
         toolbar.addAction(add_series_action)
 
+        add_dataset_action = QAction("Add Dataset", self)
+        add_dataset_action.triggered.connect(self.add_dataset)
+        toolbar.addAction(add_dataset_action)
+
         self.show_grids_action = QAction("Show Grids", self)
         self.show_grids_action.setCheckable(True)
         self.show_grids_action.setChecked(False)
         self.show_grids_action.toggled.connect(self.toggle_grids)
         toolbar.addAction(self.show_grids_action)
 
+        self.compact_action = QAction("Compact Dtypes", self)
+        self.compact_action.setCheckable(True)
+        self.compact_action.setChecked(False)
+        toolbar.addAction(self.compact_action)
+
+        memory_action = QAction("Memory", self)
+        memory_action.triggered.connect(self.show_memory_panel)
+        toolbar.addAction(memory_action)
+
         main_splitter = QSplitter(Qt.Orientation.Horizontal)
         container = QWidget()
         main_layout = QHBoxLayout(container)
@@ -97,7 +131,8 @@ class MainWindow(QMainWindow):
                 "Log Transform",
                 "Box-Cox Transform",
                 "Standard Scale (Z)",
-                "MinMax Scale"
+                "MinMax Scale",
+                "Pipeline"
             ],
             "Analysis": [
                 "Seasonal Decompose",
@@ -117,29 +152,206 @@ class MainWindow(QMainWindow):
         main_splitter.addWidget(self.sidebar)
 
         self.tab_widget = QTabWidget()
+        self.tab_widget.setTabsClosable(True)
+        self.tab_widget.tabCloseRequested.connect(self._close_tab)
         main_splitter.addWidget(self.tab_widget)
 
         self.series_frames = {}
         self.series_selected = {}
+        self.series_sources = {}
+        self.series_options = {}
         self.result_widgets = {}
+        self.table_widgets = {}
+        self.figure_panels = {}
+        self.pipelines = {}
+        self.figure_cache = FigureCache(on_evict=self._drop_figure)
+        self.result_cache = ResultCache(spill_dir=tempfile.mkdtemp(prefix='qlab-results-'))
+        self._followers = {}
+        self._ingestions = []
+        self._loader = None
 
     def add_series(self):
         paths, _ = QFileDialog.getOpenFileNames(self, "Add CSV Series", "", "CSV Files (*.csv)")
+        jobs = []
         for path in paths:
-            df = load_csv(path)
-            cols = self.select_column(df)
+            header = scan_csv_header(path)
+            cols = self.select_column(header.columns)
             if cols:
-                tab_name = Path(path).stem
-                self._create_tab(tab_name, df, cols)
+                jobs.append((path, header.columns.tolist(), cols))
+        if not jobs:
+            return
+        if len(jobs) == 1 and Path(jobs[0][0]).stat().st_size <= STREAMING_THRESHOLD_BYTES:
+            path, all_cols, cols = jobs[0]
+            compact = self.compact_action.isChecked()
+            self._open_series(path, all_cols, cols, self._load_columns(path, cols, compact=compact), compact=compact)
+            return
+        self._ingest_parallel(jobs)
+
+    def _open_series(self, path, all_cols, cols, df, compact=False):
+        tab_name = Path(path).stem
+        self.series_sources[tab_name] = (path, all_cols)
+        self.series_options[tab_name] = {'compact': compact}
+        self._create_tab(tab_name, df, cols)
+
+    def _ingest_parallel(self, jobs):
+        if self._loader is None:
+            self._loader = ParallelLoader()
+        loader = self._loader
+        batch = loader.batch()
+        dlg = QDialog(self)
+        dlg.setWindowTitle("Loading Series")
+        layout = QVBoxLayout(dlg)
+        bars = {}
+        pending = {}
+        for path, all_cols, cols in jobs:
+            layout.addWidget(QLabel(Path(path).name))
+            bar = QProgressBar(dlg)
+            # Files below the streaming threshold are parsed in one call and only report completion.
+            bar.setRange(0, 1000 if Path(path).stat().st_size > STREAMING_THRESHOLD_BYTES else 0)
+            layout.addWidget(bar)
+            bars[str(path)] = bar
+            compact = self.compact_action.isChecked()
+            pending[loader.submit(path, cols, compact=compact, batch=batch)] = (path, all_cols, cols, compact)
+        cancel_btn = QPushButton("Cancel", dlg)
+        cancel_btn.clicked.connect(lambda: loader.cancel(batch))
+        layout.addWidget(cancel_btn)
+
+        timer = QTimer(dlg)
+        entry = (dlg, timer)
+
+        def poll():
+            for path, (done, total) in loader.poll_progress().items():
+                if path in bars and bars[path].maximum():
+                    bars[path].setValue(int(1000 * done / max(total, 1)))
+            for future in [f for f in pending if f.done()]:
+                path, all_cols, cols, compact = pending.pop(future)
+                bar = bars[str(path)]
+                bar.setRange(0, 1000)
+                if future.cancelled() or loader.cancelled(batch):
+                    bar.setFormat("Cancelled")
+                    continue
+                try:
+                    df = frame_from_payload(future.result())
+                except Exception as e:
+                    bar.setFormat(f"Failed: {str(e)}")
+                    continue
+                bar.setValue(1000)
+                self._open_series(path, all_cols, cols, df, compact=compact)
+            if not pending:
+                timer.stop()
+                if entry in self._ingestions:
+                    self._ingestions.remove(entry)
+                dlg.accept()
+
+        timer.setInterval(INGEST_POLL_MS)
+        timer.timeout.connect(poll)
+        self._ingestions.append(entry)
+        timer.start()
+        dlg.show()
+
+    def _load_columns(self, path, cols, compact=None):
+        if Path(path).stat().st_size > STREAMING_THRESHOLD_BYTES:
+            return SeriesStore.from_csv(path, usecols=cols).frame(cols)
+        return load_csv_cached(path, usecols=cols, compact=self.compact_action.isChecked() if compact is None else compact)
+
+    def add_dataset(self):
+        directory = QFileDialog.getExistingDirectory(self, "Add Sharded CSV Dataset")
+        if not directory:
+            return
+        dataset = PartitionedDataset(directory)
+        dataset.register()
+        first, last = dataset.time_bounds()
+        if first is None:
+            return
+        cols = self.select_column(dataset.columns())
+        if not cols:
+            return
+
+        dlg = QDialog(self)
+        dlg.setWindowTitle("Dataset Time Range")
+        layout = QVBoxLayout(dlg)
+        layout.addWidget(QLabel("From:"))
+        start_edit = QDateTimeEdit(max(first, last - pd.Timedelta(days=7)).to_pydatetime(), dlg)
+        start_edit.setCalendarPopup(True); layout.addWidget(start_edit)
+        layout.addWidget(QLabel("To:"))
+        end_edit = QDateTimeEdit(last.to_pydatetime(), dlg)
+        end_edit.setCalendarPopup(True); layout.addWidget(end_edit)
+        btn_layout = QHBoxLayout(); ok_btn = QPushButton("OK", dlg); cancel_btn = QPushButton("Cancel", dlg)
+        ok_btn.clicked.connect(dlg.accept); cancel_btn.clicked.connect(dlg.reject)
+        btn_layout.addWidget(ok_btn); btn_layout.addWidget(cancel_btn); layout.addLayout(btn_layout)
+        if dlg.exec() != QDialog.DialogCode.Accepted:
+            return
+
+        start = pd.Timestamp(start_edit.dateTime().toPyDateTime())
+        end = pd.Timestamp(end_edit.dateTime().toPyDateTime())
+        df = dataset.query(start, end, cols)
+        tab_name = f"{Path(directory).name} [{start:%Y-%m-%d}..{end:%Y-%m-%d}]"
+        self._create_tab(tab_name, df, cols)
+
+    def tab_memory(self, name) -> dict:
+        sources = {
+            'Series': [self.series_frames.get(name)],
+            'Original': [self.original_data.get(name, (None,))[0]] if hasattr(self, "original_data") else [],
+        }
+        seen = set()
+        usage = {}
+        for label, frames in sources.items():
+            resident = mapped = 0
+            for frame in frames:
+                if frame is None or id(frame) in seen:
+                    continue
+                seen.add(id(frame))
+                r, m = frame_memory(frame)
+                resident += r
+                mapped += m
+            usage[label] = (resident, mapped)
+        follow = self._followers.get(name)
+        if follow is not None:
+            # A followed tab's series views the append buffer; report what the buffer has reserved.
+            usage['Series'] = (follow[1].nbytes, usage['Series'][1])
+        usage['Cached results'] = (self.result_cache.nbytes(tag=name), 0)
+        return usage
+
+    def show_memory_panel(self):
+        names = [self.tab_widget.tabText(i) for i in range(self.tab_widget.count())]
+        labels = ['Series', 'Original', 'Cached results']
+        dlg = QDialog(self)
+        dlg.setWindowTitle("Memory per Tab")
+        layout = QVBoxLayout(dlg)
+        table = QTableWidget(len(names) + 1, len(labels) + 2, dlg)
+        table.setHorizontalHeaderLabels(['Tab'] + labels + ['Total'])
+        totals = [0] * (len(labels) + 1)
+        for row, name in enumerate(names):
+            usage = self.tab_memory(name)
+            table.setItem(row, 0, QTableWidgetItem(name))
+            row_total = 0
+            for j, label in enumerate(labels):
+                resident, mapped = usage[label]
+                row_total += resident
+                totals[j] += resident
+                text = _format_bytes(resident) + (f" (+{_format_bytes(mapped)} mapped)" if mapped else "")
+                table.setItem(row, j + 1, QTableWidgetItem(text))
+            totals[-1] += row_total
+            table.setItem(row, len(labels) + 1, QTableWidgetItem(_format_bytes(row_total)))
+        table.setItem(len(names), 0, QTableWidgetItem("All tabs"))
+        for j, total in enumerate(totals):
+            table.setItem(len(names), j + 1, QTableWidgetItem(_format_bytes(total)))
+        table.resizeColumnsToContents()
+        layout.addWidget(table)
+        ok_btn = QPushButton("OK", dlg)
+        ok_btn.clicked.connect(dlg.accept)
+        layout.addWidget(ok_btn)
+        dlg.resize(700, 300)
+        dlg.exec()
 
-    def select_column(self, df):
+    def select_column(self, columns):
         dlg = QDialog(self)
         dlg.setWindowTitle("Select Column to Plot")
         layout = QVBoxLayout(dlg)
         layout.addWidget(QLabel("Select one column to plot against time index:"))
         listw = QListWidget(dlg)
         listw.setSelectionMode(QListWidget.SelectionMode.SingleSelection)
-        for col in df.columns:
+        for col in columns:
             item = QListWidgetItem(col)
             listw.addItem(item)
         layout.addWidget(listw)
@@ -155,12 +367,19 @@ class MainWindow(QMainWindow):
         splitter = QSplitter(Qt.Orientation.Vertical, tab)
 
         chart = ChartCanvas(splitter)
+        chart.pyramids = self._build_pyramids(name, df, cols)
         chart.plot_data(df, cols)
 
         result = QTextEdit(splitter)
         result.setReadOnly(True)
         result.hide()
 
+        table = DataTableView(parent=splitter)
+        table.hide()
+
+        figures = FigurePanel(splitter)
+        figures.hide()
+
         layout = QVBoxLayout(tab)
         layout.addWidget(splitter)
 
@@ -169,21 +388,117 @@ class MainWindow(QMainWindow):
         view3d_btn.setFixedWidth(100)
         view3d_btn.setStyleSheet("background-color: #2d2d2d; color: white;")
 
+        follow_btn = QPushButton("Follow File", tab)
+        follow_btn.setCheckable(True)
+        follow_btn.setEnabled(name in self.series_sources)
+        follow_btn.toggled.connect(lambda checked: self._toggle_follow(name, chart, checked))
+        follow_btn.setFixedWidth(100)
+        follow_btn.setStyleSheet("background-color: #2d2d2d; color: white;")
+
         btn_layout = QHBoxLayout()
         btn_layout.addStretch()
+        btn_layout.addWidget(follow_btn)
         btn_layout.addWidget(view3d_btn)
         layout.addLayout(btn_layout)
 
         self.series_frames[name] = df
         self.series_selected[name] = cols
         self.result_widgets[name] = result
+        self.table_widgets[name] = table
+        self.figure_panels[name] = figures
 
         if not hasattr(self, "original_data"): 
             self.original_data = {}
-        self.original_data[name] = (df.copy(), cols.copy())
+        self.original_data[name] = (df, cols.copy())
 
         self.tab_widget.addTab(tab, name)
 
+    def _close_tab(self, index):
+        name = self.tab_widget.tabText(index)
+        entry = self._followers.pop(name, None)
+        if entry:
+            entry[2].stop()
+        stores = [self.series_frames, self.series_selected, self.series_sources, self.series_options, self.result_widgets,
+                  self.table_widgets, self.figure_panels, self.pipelines, getattr(self, "original_data", {})]
+        for store in stores:
+            store.pop(name, None)
+        self.result_cache.drop_tag(name)
+        tab = self.tab_widget.widget(index)
+        self.tab_widget.removeTab(index)
+        tab.deleteLater()
+
+    def closeEvent(self, event):
+        for entry in self._followers.values():
+            entry[2].stop()
+        for _, timer in self._ingestions:
+            timer.stop()
+        if self._loader is not None:
+            self._loader.shutdown()
+            self._loader = None
+        self.result_cache.clear()
+        shutil.rmtree(self.result_cache.spill_dir, ignore_errors=True)
+        super().closeEvent(event)
+
+    def _toggle_follow(self, name, chart, checked):
+        if not checked:
+            entry = self._followers.pop(name, None)
+            if entry:
+                entry[2].stop()
+            return
+
+        path, _ = self.series_sources[name]
+        cols = self.series_selected[name]
+        result = self.result_widgets.get(name)
+        try:
+            follower = CsvFollower(path, usecols=cols)
+            buffer = AppendBuffer(follower.load()[cols])
+        except Exception as e:
+            result.setText(f"Error following {path}: {str(e)}")
+            result.show()
+            return
+
+        self.series_frames[name] = buffer.frame()
+        chart.plot_data(self.series_frames[name], cols)
+
+        timer = QTimer(self)
+        timer.setInterval(FOLLOW_INTERVAL_MS)
+        timer.timeout.connect(lambda: self._poll_follow(name))
+        self._followers[name] = (follower, buffer, timer, chart)
+        timer.start()
+
+    def _poll_follow(self, name):
+        entry = self._followers.get(name)
+        if entry is None:
+            return
+        follower, buffer, timer, chart = entry
+        try:
+            new_rows = follower.poll()
+        except Exception as e:
+            timer.stop()
+            self._followers.pop(name, None)
+            result = self.result_widgets.get(name)
+            result.setText(f"Stopped following {follower.path}: {str(e)}")
+            result.show()
+            return
+        if new_rows is None:
+            return
+        previous = self.series_frames[name]
+        buffer.append(new_rows)
+        self.series_frames[name] = buffer.frame()
+        chart.extend_data(previous, self.series_frames[name], self.series_selected[name])
+
+    def _build_pyramids(self, name, df, cols):
+        if len(df) < PYRAMID_MIN_ROWS or not isinstance(df.index, pd.DatetimeIndex) or not df.index.is_monotonic_increasing:
+            return {}
+        source = self.series_sources.get(name, (None,))[0]
+        options = self.series_options.get(name)
+        pyramids = {}
+        for col in cols:
+            if not pd.api.types.is_numeric_dtype(df[col]):
+                continue
+            pyramids[col] = series_pyramid(df.index.asi8, column_values(df[col]), source=source, column=col, options=options)
+        return pyramids
+
     def on_sidebar_click(self, item, _):
         if item.childCount() > 0:
             return
@@ -200,7 +515,11 @@ class MainWindow(QMainWindow):
         if df is None or not cols or not chart:
             return
 
-        data = df[cols]
+        data = df if list(df.columns) == cols else df[cols]
+
+        table = self.table_widgets.get(tab_name)
+        if table is not None and method != "Show Raw Data":
+            table.hide()
 
         if method == "Rolling Mean":
             try:
@@ -215,11 +534,11 @@ class MainWindow(QMainWindow):
                 if dlg.exec() != QDialog.DialogCode.Accepted:
                     return
                 window = int(win_spin.value())
-                self._run_async(lambda: rolling_mean(data, window=window), lambda r: (chart.plot_data(r, cols), result.hide()), result)
+                self._run_async(lambda: self.result_cache.call(rolling_mean, data, tag=tab_name, window=window), lambda r: (chart.plot_data(r, cols), result.hide()), result)
             except Exception as e:
                 result.setText(f"Error in Rolling Mean: {str(e)}"); result.show()
         elif method == "Differencing":
-            self._run_async(lambda: differencing(data), lambda r: (chart.plot_data(r, cols), result.hide()), result)
+            self._run_async(lambda: self.result_cache.call(differencing, data, tag=tab_name), lambda r: (chart.plot_data(r, cols), result.hide()), result)
         elif method == "EWMA":
             try:
                 dlg = QDialog(self)
@@ -233,43 +552,54 @@ class MainWindow(QMainWindow):
                 if dlg.exec() != QDialog.DialogCode.Accepted:
                     return
                 span = int(span_spin.value())
-                self._run_async(lambda: ewma(data, span=span), lambda r: (chart.plot_data(r, cols), result.hide()), result)
+                self._run_async(lambda: self.result_cache.call(ewma, data, tag=tab_name, span=span), lambda r: (chart.plot_data(r, cols), result.hide()), result)
             except Exception as e:
                 result.setText(f"Error in EWMA: {str(e)}"); result.show()
         elif method == "Log Transform":
-            try:
-                transformed, offset = log_transform(data)
+            def on_log(r):
+                transformed, offset = r
                 chart.plot_data(transformed, transformed.columns.tolist())
-                fig1 = plot_distribution(transformed, title_prefix="Log Transform Distribution")
-                fig2 = plot_before_after(data, transformed, title_prefix="Log Transform")
-                import matplotlib.pyplot as _plt
-                _plt.show()
+                self._show_figure(tab_name, data, "Log Transform", {}, lambda: plot_before_after(data, transformed, title_prefix="Log Transform"), result, hide_result=False)
+                self._show_dist(tab_name, "Log Transform Distribution", transformed, result)
                 result.setText(f"Applied log transform. Offset used: {offset}")
                 result.show()
-            except Exception as e:
-                result.setText(f"Error in log transform: {str(e)}")
-                result.show()
+
+            self._run_async(lambda: self.result_cache.call(log_transform, data, tag=tab_name), on_log, result)
         elif method == "Box-Cox Transform":
-            try:
-                transformed, lmbda, shift = boxcox_transform(data)
+            def on_boxcox(r):
+                transformed, lmbda, shift = r
                 chart.plot_data(transformed, transformed.columns.tolist())
-                fig1 = plot_distribution(transformed, title_prefix="Box-Cox Distribution")
-                fig2 = plot_before_after(data, transformed, title_prefix="Box-Cox")
-                import matplotlib.pyplot as _plt
-                _plt.show()
+                self._show_figure(tab_name, data, "Box-Cox", {}, lambda: plot_before_after(data, transformed, title_prefix="Box-Cox"), result, hide_result=False)
+                self._show_dist(tab_name, "Box-Cox Distribution", transformed, result)
                 result.setText(f"Applied Box-Cox. lambda={lmbda:.4f}, shift={shift:.4f}\nUse inverse with same parameters to restore.")
                 result.show()
-            except Exception as e:
-                result.setText(f"Error in Box-Cox transform: {str(e)}")
-                result.show()
+
+            self._run_async(lambda: self.result_cache.call(boxcox_transform, data, tag=tab_name), on_boxcox, result)
         elif method == "Standard Scale (Z)":
-            self._run_async(lambda: standard_scale(data), lambda scaled: (chart.plot_data(scaled, scaled.columns.tolist()), self._show_dist("Z-Scale Distribution", scaled), result.hide()), result)
+            self._run_async(lambda: self.result_cache.call(standard_scale, data, tag=tab_name), lambda scaled: (chart.plot_data(scaled, scaled.columns.tolist()), result.hide(), self._show_dist(tab_name, "Z-Scale Distribution", scaled, result)), result)
+        elif method == "Pipeline":
+            pipeline = self.pipelines.get(tab_name)
+            text, ok = QInputDialog.getText(
+                self, "Preprocessing Pipeline", "Steps (log, boxcox, diff, rolling_mean, ewma, zscale, minmax), e.g. minmax feature_range=(-1, 1):",
+                text=pipeline.describe() if pipeline else "log | diff periods=1 | rolling_mean window=5 | zscale",
+            )
+            if not ok:
+                return
+            try:
+                steps = parse_pipeline(text).steps
+            except ValueError as e:
+                result.setText(f"Error in pipeline: {str(e)}")
+                result.show()
+                return
+            if pipeline is None:
+                pipeline = self.pipelines[tab_name] = PreprocessingPipeline()
+            self._run_async(lambda: pipeline.run(data, steps=steps), lambda r: (chart.plot_data(r, r.columns.tolist()), result.hide()), result)
         elif method == "MinMax Scale":
-            self._run_async(lambda: minmax_scale(data), lambda scaled: (chart.plot_data(scaled, scaled.columns.tolist()), self._show_dist("MinMax Distribution", scaled), result.hide()), result)
+            self._run_async(lambda: self.result_cache.call(minmax_scale, data, tag=tab_name), lambda scaled: (chart.plot_data(scaled, scaled.columns.tolist()), result.hide(), self._show_dist(tab_name, "MinMax Distribution", scaled, result)), result)
         elif method == "Seasonal Decompose":
-            self._run_async(
-                lambda: seasonal_decompose(data),
-                lambda decomp: (build_seasonal_decomposition_figure(decomp), plt.show(), result.hide()),
+            self._show_figure(
+                tab_name, data, "Seasonal Decompose", {},
+                lambda: build_seasonal_decomposition_figure(self.result_cache.call(seasonal_decompose, data, tag=tab_name)),
                 result,
             )
         elif method == "ARIMA":
@@ -278,14 +608,14 @@ class MainWindow(QMainWindow):
                 if params is None:
                     return
                 p, d, q, steps = params
-                self._run_async(lambda: arima_forecast_with_ci(data, order=(p, d, q), steps=steps), lambda r: (chart.plot_data(r[0], [r[0].columns[0], 'Forecast'], ci_lower=r[1], ci_upper=r[2]), result.hide()), result)
+                self._run_async(lambda: self.result_cache.call(arima_forecast_with_ci, data, tag=tab_name, order=(p, d, q), steps=steps), lambda r: (chart.plot_data(r[0], [r[0].columns[0], 'Forecast'], ci_lower=r[1], ci_upper=r[2]), result.hide()), result)
             except Exception as e:
                 result.setText(f"Error in ARIMA forecasting: {str(e)}")
                 result.show()
         elif method == "Show ACF/PACF":
-            self._run_async(
-                lambda: prepare_acf_pacf_data(data, lags=40),
-                lambda out: (build_acf_pacf_figure(out[0], out[1]), plt.show(), result.hide()),
+            self._show_figure(
+                tab_name, data, "ACF/PACF", {'lags': 40},
+                lambda: build_acf_pacf_figure(self.result_cache.call(compute_acf_pacf, data, tag=tab_name, lags=40)),
                 result,
             )
         elif method == "SARIMAX":
@@ -301,7 +631,8 @@ class MainWindow(QMainWindow):
                 P_spin = QSpinBox(dlg); P_spin.setRange(0, 10); P_spin.setValue(0); layout.addWidget(P_spin)
                 D_spin = QSpinBox(dlg); D_spin.setRange(0, 2); D_spin.setValue(0); layout.addWidget(D_spin)
                 Q_spin = QSpinBox(dlg); Q_spin.setRange(0, 10); Q_spin.setValue(0); layout.addWidget(Q_spin)
-                m_spin = QSpinBox(dlg); m_spin.setRange(0, 365); m_spin.setValue(0); layout.addWidget(m_spin)
+                m_spin = QSpinBox(dlg); m_spin.setRange(-1, 365); m_spin.setSpecialValueText("Auto"); m_spin.setValue(0); layout.addWidget(m_spin)
+                self._add_period_hint(tab_name, data, layout, dlg)
                 layout.addWidget(QLabel("Steps ahead:"))
                 steps_spin = QSpinBox(dlg); steps_spin.setRange(1, 5000); steps_spin.setValue(30); layout.addWidget(steps_spin)
                 btn_layout = QHBoxLayout()
@@ -311,9 +642,10 @@ class MainWindow(QMainWindow):
                 if dlg.exec() != QDialog.DialogCode.Accepted:
                     return
                 order = (int(p_spin.value()), int(d_spin.value()), int(q_spin.value()))
-                seasonal_order = (int(P_spin.value()), int(D_spin.value()), int(Q_spin.value()), int(m_spin.value()))
+                m = int(m_spin.value())
+                seasonal_order = (int(P_spin.value()), int(D_spin.value()), int(Q_spin.value()), m if m >= 0 else None)
                 steps = int(steps_spin.value())
-                self._run_async(lambda: sarimax_forecast_with_ci(data, order=order, seasonal_order=seasonal_order, steps=steps), lambda r: (chart.plot_data(r[0], [r[0].columns[0], 'Forecast'], ci_lower=r[1], ci_upper=r[2]), result.hide()), result)
+                self._run_async(lambda: self.result_cache.call(sarimax_forecast_with_ci, data, tag=tab_name, order=order, seasonal_order=seasonal_order, steps=steps), lambda r: (chart.plot_data(r[0], [r[0].columns[0], 'Forecast'], ci_lower=r[1], ci_upper=r[2]), result.hide()), result)
             except Exception as e:
                 result.setText(f"Error in SARIMAX forecasting: {str(e)}")
                 result.show()
@@ -323,7 +655,8 @@ class MainWindow(QMainWindow):
                 dlg.setWindowTitle("Holt-Winters Parameters")
                 layout = QVBoxLayout(dlg)
                 layout.addWidget(QLabel("Seasonal periods (m):"))
-                m_spin = QSpinBox(dlg); m_spin.setRange(0, 365); m_spin.setValue(12); layout.addWidget(m_spin)
+                m_spin = QSpinBox(dlg); m_spin.setRange(-1, 365); m_spin.setSpecialValueText("Auto"); m_spin.setValue(-1); layout.addWidget(m_spin)
+                self._add_period_hint(tab_name, data, layout, dlg)
                 layout.addWidget(QLabel("Steps ahead:"))
                 steps_spin = QSpinBox(dlg); steps_spin.setRange(1, 5000); steps_spin.setValue(30); layout.addWidget(steps_spin)
                 btn_layout = QHBoxLayout(); ok_btn = QPushButton("OK", dlg); cancel_btn = QPushButton("Cancel", dlg)
@@ -332,7 +665,7 @@ class MainWindow(QMainWindow):
                 if dlg.exec() != QDialog.DialogCode.Accepted:
                     return
                 m = int(m_spin.value()); steps = int(steps_spin.value())
-                self._run_async(lambda: holt_winters_forecast(data, steps=steps, seasonal_periods=(m if m > 0 else None), trend='add', seasonal=('add' if m > 0 else None)), lambda forecast_df: (chart.plot_data(forecast_df, [forecast_df.columns[0], 'Forecast']), result.hide()), result)
+                self._run_async(lambda: self.result_cache.call(holt_winters_forecast, data, tag=tab_name, steps=steps, seasonal_periods=(m if m > 0 else None), trend='add', seasonal=('add' if m != 0 else None)), lambda forecast_df: (chart.plot_data(forecast_df, [forecast_df.columns[0], 'Forecast']), result.hide()), result)
             except Exception as e:
                 result.setText(f"Error in Holt-Winters forecasting: {str(e)}")
                 result.show()
@@ -349,7 +682,7 @@ class MainWindow(QMainWindow):
                 if dlg.exec() != QDialog.DialogCode.Accepted:
                     return
                 periods = int(steps_spin.value())
-                self._run_async(lambda: prophet_forecast(data, periods=periods), lambda forecast_df: (chart.plot_data(forecast_df, [forecast_df.columns[0], 'Forecast']), result.hide()), result)
+                self._run_async(lambda: self.result_cache.call(prophet_forecast, data, tag=tab_name, periods=periods), lambda forecast_df: (chart.plot_data(forecast_df, [forecast_df.columns[0], 'Forecast']), result.hide()), result)
             except Exception as e:
                 result.setText(f"Error in Prophet forecasting: {str(e)}")
                 result.show()
@@ -366,9 +699,9 @@ class MainWindow(QMainWindow):
                 if dlg.exec() != QDialog.DialogCode.Accepted:
                     return
                 lam = int(lam_spin.value())
-                self._run_async(
-                    lambda: hp_filter_decompose(data, lamb=lam),
-                    lambda parts: (build_hp_filter_figure(parts[0], parts[1], parts[2], lamb=lam), plt.show(), result.hide()),
+                self._show_figure(
+                    tab_name, data, "HP Filter", {'lamb': lam},
+                    lambda: build_hp_filter_figure(*self.result_cache.call(hp_filter_decompose, data, tag=tab_name, lamb=lam), lamb=lam),
                     result,
                 )
             except Exception as e:
@@ -391,7 +724,7 @@ class MainWindow(QMainWindow):
                     return
                 thr_val = float(thr.value())
                 self._run_async(
-                    lambda: zscore_anomalies(data, threshold=thr_val),
+                    lambda: self.result_cache.call(zscore_anomalies, data, tag=tab_name, threshold=thr_val),
                     lambda r: (
                         self._plot_anomalies(chart, data, cols[0], r[2]),
                         result.setText(
@@ -421,15 +754,16 @@ class MainWindow(QMainWindow):
                 if dlg.exec() != QDialog.DialogCode.Accepted:
                     return
                 contamination = float(contam.value()) / 100.0
-                self._run_async(lambda: isolation_forest_anomalies(data, contamination=contamination), lambda r: (self._plot_anomalies(chart, data, cols[0], r[2]), result.setText(f"Isolation Forest anomalies: {int(r[1].sum())}. Contamination: {contamination:.3%}\nScore stats -> mean: {r[0]['IFScore'].mean():.3f}, max: {r[0]['IFScore'].max():.3f}"), result.show()), result)
+                self._run_async(lambda: self.result_cache.call(isolation_forest_anomalies, data, tag=tab_name, contamination=contamination), lambda r: (self._plot_anomalies(chart, data, cols[0], r[2]), result.setText(f"Isolation Forest anomalies: {int(r[1].sum())}. Contamination: {contamination:.3%}\nScore stats -> mean: {r[0]['IFScore'].mean():.3f}, max: {r[0]['IFScore'].max():.3f}"), result.show()), result)
             except Exception as e:
                 result.setText(f"Error in Isolation Forest anomalies: {str(e)}")
                 result.show()
         elif method == "Stationarity Tests":
-            self._run_async(lambda: stationarity_tests(data), lambda report: (result.setText(report), result.show()), result)
+            self._run_async(lambda: self.result_cache.call(stationarity_tests, data, tag=tab_name), lambda report: (result.setText(report), result.show()), result)
         elif method == "Show Raw Data":
-            result.setText(data.to_string())
-            result.show()
+            table.set_frame(data)
+            table.show()
+            result.hide()
         elif method == "Show Summary":
             result.setText(data.describe().to_string())
             result.show()
@@ -443,9 +777,20 @@ class MainWindow(QMainWindow):
         class _Bridge(QObject):
             finished = pyqtSignal(object)
             error = pyqtSignal(object)
-        bridge = _Bridge()
-        bridge.finished.connect(on_success)
-        bridge.error.connect(lambda ex: (result_widget.setText(str(ex)), result_widget.show()))
+        # Parented to the window so the bridge outlives the worker until its queued signal is delivered.
+        bridge = _Bridge(self)
+
+        def finished(out):
+            bridge.deleteLater()
+            on_success(out)
+
+        def failed(ex):
+            bridge.deleteLater()
+            result_widget.setText(str(ex))
+            result_widget.show()
+
+        bridge.finished.connect(finished)
+        bridge.error.connect(failed)
 
         class _Task(QRunnable):
             def __init__(self, fn, bridge):
@@ -460,13 +805,54 @@ class MainWindow(QMainWindow):
                     self_inner.bridge.error.emit(ex)
         self._thread_pool.start(_Task(fn, bridge))
 
-    def _show_dist(self, title, data):
-        try:
-            fig = plot_distribution(data, title_prefix=title)
-            import matplotlib.pyplot as _plt
-            _plt.show()
-        except Exception:
-            pass
+    def _show_figure(self, tab_name, data, method, params, build, result, hide_result=True):
+        key = FigureCache.key(frame_fingerprint(data), method, params)
+        fig = self.figure_cache.get(key)
+        if fig is not None:
+            self._embed_figure(tab_name, key, method, fig)
+            if hide_result:
+                result.hide()
+            return
+
+        def on_built(fig):
+            self.figure_cache.put(key, fig)
+            self._embed_figure(tab_name, key, method, fig)
+            if hide_result:
+                result.hide()
+
+        self._run_async(build, on_built, result)
+
+    def _embed_figure(self, tab_name, key, title, fig):
+        for name, panel in self.figure_panels.items():
+            if name != tab_name and key in panel:
+                panel.drop(key)
+        panel = self.figure_panels.get(tab_name)
+        if panel is not None:
+            panel.show_figure(key, title, fig)
+
+    def _drop_figure(self, key, fig):
+        for panel in self.figure_panels.values():
+            panel.drop(key)
+
+    def _show_dist(self, tab_name, title, data, result):
+        if data.shape[1] != 1:
+            return
+        self._show_figure(tab_name, data, title, {}, lambda: plot_distribution(data, title_prefix=title), result, hide_result=False)
+
+    def _add_period_hint(self, tab_name, data, layout, parent):
+        hint = QLabel("Detecting seasonal periods...", parent)
+        layout.addWidget(hint)
+
+        def on_found(candidates):
+            try:
+                hint.setText(
+                    "Detected periods: " + ", ".join(str(p) for p, _ in candidates)
+                    if candidates else "No seasonal period detected"
+                )
+            except RuntimeError:
+                pass
+
+        self._run_async(lambda: self.result_cache.call(seasonal_period_candidates, data, tag=tab_name), on_found, hint)
 
     def _plot_anomalies(self, chart, data, col_name, anomalies_df):
         overlay_df = data.copy()
@@ -493,7 +879,8 @@ class MainWindow(QMainWindow):
         listw.setSelectionMode(QListWidget.SelectionMode.SingleSelection)
     
         current_col = self.series_selected[tab_name][0]
-        for col in df.columns:
+        path, all_cols = self.series_sources.get(tab_name, (None, df.columns.tolist()))
+        for col in all_cols:
             if col != current_col:
                 item = QListWidgetItem(col)
                 listw.addItem(item)
@@ -507,6 +894,8 @@ class MainWindow(QMainWindow):
             current = listw.currentItem()
             if current:
                 second_col = current.text()
+                if second_col not in df.columns and path is not None:
+                    df = self._load_columns(path, [current_col, second_col])
                 tab = self.tab_widget.widget(self.tab_widget.currentIndex())
                 chart = tab.findChild(ChartCanvas)
                 if chart:
@@ -554,6 +943,13 @@ class MainWindow(QMainWindow):
             return int(p_spin.value()), int(d_spin.value()), int(q_spin.value()), int(steps_spin.value())
         return None
 
+def _format_bytes(n):
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if n < 1024 or unit == 'GB':
+            return f"{n:.0f} {unit}" if unit == 'B' else f"{n:.1f} {unit}"
+        n /= 1024
+
+
 if __name__ == '__main__':
     import sys
     app = QApplication(sys.argv)
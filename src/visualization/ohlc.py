@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+
+from src.visualization.decimation import visible_slice
+
+
+CANDLE_MIN_PIXELS = 4
+OHLC_BAR_SIZES = [
+    pd.Timedelta(s).value for s in (
+        '1s', '5s', '15s', '30s', '1min', '5min', '15min', '30min',
+        '1h', '2h', '4h', '12h', '1D', '7D', '30D', '91D', '365D',
+    )
+]
+OHLC_COLUMNS = ['Open', 'High', 'Low', 'Close']
+
+
+def bar_size_for(span_ns: int, rows: int, max_bars: int) -> int | None:
+    """Smallest bar size from OHLC_BAR_SIZES giving at most max_bars bars over span_ns, None if rows already fit."""
+    if rows <= max_bars:
+        return None
+    for size in OHLC_BAR_SIZES:
+        if span_ns / size <= max_bars:
+            return size
+    return int(-(-span_ns // max_bars))
+
+
+def aggregate_ohlc(ohlc: pd.DataFrame, bar_ns: int) -> pd.DataFrame:
+    """First/max/min/last per epoch-aligned bar of bar_ns nanoseconds over a sorted DatetimeIndex."""
+    if len(ohlc) == 0:
+        return ohlc
+    x = ohlc.index.asi8
+    bucket = np.floor_divide(x, bar_ns)
+    starts = np.flatnonzero(np.diff(bucket, prepend=bucket[0] - 1))
+    ends = np.append(starts[1:], len(x)) - 1
+    opens = ohlc['Open'].to_numpy(dtype=np.float64)
+    highs = ohlc['High'].to_numpy(dtype=np.float64)
+    lows = ohlc['Low'].to_numpy(dtype=np.float64)
+    closes = ohlc['Close'].to_numpy(dtype=np.float64)
+    with np.errstate(invalid='ignore'):
+        high = np.fmax.reduceat(highs, starts)
+        low = np.fmin.reduceat(lows, starts)
+    index = pd.DatetimeIndex(bucket[starts] * bar_ns, tz=ohlc.index.tz, name=ohlc.index.name)
+    return pd.DataFrame(
+        {'Open': opens[starts], 'High': high, 'Low': low, 'Close': closes[ends]},
+        index=index,
+    )
+
+
+def visible_ohlc(ohlc: pd.DataFrame, max_bars: int, lo=None, hi=None) -> pd.DataFrame:
+    """Bars for [lo, hi] padded by one view width per side, at the finest bar size that fits max_bars."""
+    x = ohlc.index.asi8
+    if len(x) == 0:
+        return ohlc
+    lo = x[0] if lo is None else lo
+    hi = x[-1] if hi is None else hi
+    i0, i1 = visible_slice(x, lo, hi)
+    bar_ns = bar_size_for(max(int(hi - lo), 1), i1 - i0, max(1, max_bars))
+    width = hi - lo
+    p0, p1 = visible_slice(x, lo - width, hi + width)
+    window = ohlc.iloc[p0:p1]
+    return window if bar_ns is None else aggregate_ohlc(window, bar_ns)
@@ -1,5 +1,10 @@
+from PyQt6.QtCore import QTimer
+import matplotlib.dates as mdates
 import pandas as pd
 import mplfinance as mpf
+from src.visualization.ohlc import visible_ohlc, OHLC_COLUMNS, CANDLE_MIN_PIXELS
+
+OHLC_REAGGREGATE_MS = 50
 
 
 def infer_data_type(df: pd.DataFrame) -> str:
@@ -19,8 +24,17 @@ def infer_data_type(df: pd.DataFrame) -> str:
 class PlotManager:
     def __init__(self, plot_widget):
         self.plot_widget = plot_widget
+        self._ohlc = None
+        self._pending_axes = None
+        self._zoom_timer = QTimer(plot_widget)
+        self._zoom_timer.setSingleShot(True)
+        self._zoom_timer.setInterval(OHLC_REAGGREGATE_MS)
+        self._zoom_timer.timeout.connect(self._reaggregate)
 
     def render(self, df: pd.DataFrame):
+        self._zoom_timer.stop()
+        self._ohlc = None
+        self._pending_axes = None
         dtype = infer_data_type(df)
         if dtype == 'financial':
             self._plot_financial(df)
@@ -34,21 +48,50 @@ class PlotManager:
             self._plot_generic(df)
 
     def _plot_financial(self, df: pd.DataFrame):
-        def plot_candle(ax):
-            rename_map = {'open': 'Open', 'high': 'High', 'low': 'Low', 'close': 'Close'}
-            ohlc = df.rename(columns=rename_map)[['Open', 'High', 'Low', 'Close']]
-            mpf.plot(
-                ohlc,
-                type='candle',
-                style='charles',
-                ax=ax,
-                volume=False,
-                datetime_format='%Y-%m-%d',
-                warn_too_much_data=len(ohlc) + 1
-            )
-            ax.set_facecolor('#222222')
-
-        self.plot_widget.plot(plot_candle)
+        rename_map = {'open': 'Open', 'high': 'High', 'low': 'Low', 'close': 'Close'}
+        ohlc = df.rename(columns=rename_map)[OHLC_COLUMNS]
+        if not ohlc.index.is_monotonic_increasing:
+            ohlc = ohlc.sort_index()
+        self._ohlc = ohlc
+        self.plot_widget.plot(lambda ax: self._draw_candles(ax, None))
+
+    def _draw_candles(self, ax, xlim):
+        ohlc = self._ohlc
+        if xlim is None:
+            lo = hi = None
+        else:
+            lo, hi = (mdates.num2date(v).timestamp() * 1e9 for v in xlim)
+        width_px = ax.bbox.width or self.plot_widget.width()
+        bars = visible_ohlc(ohlc, int(width_px // CANDLE_MIN_PIXELS), lo, hi)
+
+        ax.clear()
+        mpf.plot(
+            bars,
+            type='candle',
+            style='charles',
+            ax=ax,
+            volume=False,
+            datetime_format='%Y-%m-%d',
+            show_nontrading=True,
+            warn_too_much_data=len(bars) + 1
+        )
+        ax.set_facecolor('#222222')
+        if xlim is not None:
+            ax.set_xlim(xlim)
+        ax.callbacks.connect('xlim_changed', self._on_financial_xlim)
+
+    def _on_financial_xlim(self, ax):
+        self._pending_axes = ax
+        self._zoom_timer.start()
+
+    def _reaggregate(self):
+        ax = self._pending_axes
+        if ax is None or self._ohlc is None:
+            return
+        self._pending_axes = None
+        self._draw_candles(ax, ax.get_xlim())
+        self.plot_widget.style_axes(ax)
+        self.plot_widget.canvas.draw_idle()
 
     def _plot_sensor(self, df: pd.DataFrame):
         self.plot_widget.plot(lambda ax: df.plot(ax=ax, title="Sensor Data"))
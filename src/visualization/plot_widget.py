@@ -15,7 +15,10 @@ class PlotWidget(QWidget):
         self.fig.clear()
         ax = self.fig.add_subplot(111, facecolor="#222222")
         plot_fn(ax)
+        self.style_axes(ax)
+        self.canvas.draw()
+
+    def style_axes(self, ax):
         ax.tick_params(colors="#FFFFFF")
         for spine in ax.spines.values():
             spine.set_color("#FFFFFF")
-        self.canvas.draw()
@@ -0,0 +1,201 @@
+import hashlib
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.data_ingestion.cache import DEFAULT_CACHE_DIR
+from src.visualization.decimation import minmax_decimate, visible_slice
+
+
+DEFAULT_PYRAMID_DIR = DEFAULT_CACHE_DIR.parent / 'pyramids'
+PYRAMID_MIN_ROWS = 100_000
+LEAF_SIZE = 8
+LEVEL_FACTOR = 4
+_MIN_TOP_BUCKETS = 256
+_MATCH_SAMPLES = 1024
+
+
+class MinMaxPyramid:
+    """Multi-resolution min/max/mean summary of one sorted series, queried at screen resolution."""
+
+    def __init__(self, x: np.ndarray, y: np.ndarray, levels: list[dict], digest: str = None):
+        self.x = x
+        self.y = y
+        self.levels = levels
+        self.digest = digest
+
+    @classmethod
+    def build(cls, x: np.ndarray, y: np.ndarray, digest: str = None) -> 'MinMaxPyramid':
+        levels = []
+        level = _reduce(x, y, x, y, None, None, LEAF_SIZE)
+        level['size'] = LEAF_SIZE
+        levels.append(level)
+        while len(level['y_min']) > _MIN_TOP_BUCKETS * LEVEL_FACTOR:
+            size = level['size'] * LEVEL_FACTOR
+            level = _reduce(level['x_min'], level['y_min'], level['x_max'], level['y_max'],
+                            level['total'], level['count'], LEVEL_FACTOR)
+            level['size'] = size
+            levels.append(level)
+        return cls(x, y, levels, digest)
+
+    def matches(self, x: np.ndarray, values: np.ndarray) -> bool:
+        """Whether x and the column's raw values are the data this pyramid was built from."""
+        if self.digest is None or len(x) != len(self.x) or len(values) != len(self.y):
+            return False
+        step = max(1, len(x) // _MATCH_SAMPLES)
+        if not (np.array_equal(x[::step], self.x[::step])
+                and np.array_equal(np.asarray(values[::step], dtype=np.float64), self.y[::step], equal_nan=True)):
+            return False
+        return data_digest(x, values) == self.digest
+
+    def query(self, lo, hi, n_buckets: int, stat: str = 'minmax') -> tuple[np.ndarray, np.ndarray]:
+        i0, i1 = visible_slice(self.x, lo, hi)
+        rows = i1 - i0
+        level = None
+        for candidate in self.levels:
+            if rows / candidate['size'] < n_buckets:
+                break
+            level = candidate
+        if level is None:
+            return minmax_decimate(self.x[i0:i1], self.y[i0:i1], n_buckets)
+
+        size = level['size']
+        b0, b1 = i0 // size, -(-i1 // size)
+        if stat == 'mean':
+            count = level['count'][b0:b1]
+            with np.errstate(invalid='ignore', divide='ignore'):
+                means = level['total'][b0:b1] / count
+            centers = self.x[np.minimum(np.arange(b0, b1) * size + size // 2, len(self.x) - 1)]
+            return centers, np.where(count > 0, means, np.nan)
+
+        x_min, y_min = level['x_min'][b0:b1], level['y_min'][b0:b1]
+        x_max, y_max = level['x_max'][b0:b1], level['y_max'][b0:b1]
+        min_first = x_min <= x_max
+        xs = np.empty(2 * len(x_min), dtype=self.x.dtype)
+        ys = np.empty(2 * len(y_min), dtype=np.float64)
+        xs[0::2] = np.where(min_first, x_min, x_max)
+        xs[1::2] = np.where(min_first, x_max, x_min)
+        ys[0::2] = np.where(min_first, y_min, y_max)
+        ys[1::2] = np.where(min_first, y_max, y_min)
+        return minmax_decimate(xs, ys, n_buckets)
+
+    def save(self, path):
+        arrays = {}
+        for k, level in enumerate(self.levels):
+            for name, values in level.items():
+                if name != 'size':
+                    arrays[f'{k}_{name}'] = values
+        meta = {
+            'sizes': [level['size'] for level in self.levels],
+            'rows': len(self.y),
+            'digest': self.digest,
+        }
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + '.tmp.npz')
+        np.savez(tmp, meta=np.array(json.dumps(meta)), **arrays)
+        tmp.replace(path)
+
+    @classmethod
+    def load(cls, path, x: np.ndarray, y: np.ndarray, digest: str) -> 'MinMaxPyramid | None':
+        try:
+            with np.load(path) as data:
+                meta = json.loads(str(data['meta']))
+                if meta['rows'] != len(y) or meta.get('digest') != digest:
+                    return None
+                levels = []
+                for k, size in enumerate(meta['sizes']):
+                    level = {name: data[f'{k}_{name}'] for name in ('x_min', 'y_min', 'x_max', 'y_max', 'total', 'count')}
+                    level['size'] = size
+                    levels.append(level)
+        except (OSError, ValueError, KeyError):
+            return None
+        return cls(x, y, levels, digest)
+
+
+def column_values(series: pd.Series) -> np.ndarray:
+    """The column's values without a dtype conversion where pandas allows it."""
+    values = series.to_numpy()
+    return series.to_numpy(dtype=np.float64, na_value=np.nan) if values.dtype == object else values
+
+
+def data_digest(x: np.ndarray, values: np.ndarray) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    for array in (x, values):
+        array = np.ascontiguousarray(array)
+        digest.update(str(array.dtype).encode())
+        digest.update(array)
+    return digest.hexdigest()
+
+
+def pyramid_path(source, column, options: dict = None) -> Path:
+    key = json.dumps([str(Path(source).resolve()), str(column), options or {}], sort_keys=True)
+    return DEFAULT_PYRAMID_DIR / f"{hashlib.blake2b(key.encode(), digest_size=16).hexdigest()}.npz"
+
+
+def series_pyramid(x: np.ndarray, values: np.ndarray, source=None, column=None, options: dict = None) -> MinMaxPyramid:
+    """Load the persisted pyramid for source/column/options if it still describes the data, else build and persist it."""
+    y = np.asarray(values, dtype=np.float64)
+    digest = data_digest(x, values)
+    if source is None:
+        return MinMaxPyramid.build(x, y, digest)
+    path = pyramid_path(source, column, options)
+    pyramid = MinMaxPyramid.load(path, x, y, digest) if path.exists() else None
+    if pyramid is None:
+        pyramid = MinMaxPyramid.build(x, y, digest)
+        try:
+            pyramid.save(path)
+        except OSError:
+            pass
+    return pyramid
+
+
+def _reduce(x_min, y_min, x_max, y_max, total, count, factor) -> dict:
+    n = len(y_min)
+    full = n - n % factor
+    parts = [_reduce_blocks(
+        x_min[:full], y_min[:full], x_max[:full], y_max[:full],
+        None if total is None else total[:full], None if count is None else count[:full], factor,
+    )]
+    if full < n:
+        pad = factor - (n - full)
+
+        def tail(values, fill):
+            return np.concatenate([values[full:], np.full(pad, fill, dtype=values.dtype)])
+
+        parts.append(_reduce_blocks(
+            tail(x_min, x_min[-1]), tail(y_min, np.nan), tail(x_max, x_max[-1]), tail(y_max, np.nan),
+            None if total is None else tail(total, 0), None if count is None else tail(count, 0), factor,
+        ))
+    return {name: np.concatenate([part[name] for part in parts]) for name in parts[0]}
+
+
+def _reduce_blocks(x_min, y_min, x_max, y_max, total, count, factor) -> dict:
+    m = len(y_min) // factor
+    rows = np.arange(m)
+    low = y_min.reshape(m, factor)
+    high = y_max.reshape(m, factor)
+    with np.errstate(invalid='ignore'):
+        new_y_min = np.fmin.reduce(low, axis=1)
+        new_y_max = np.fmax.reduce(high, axis=1)
+        k_min = np.argmax(low == new_y_min[:, None], axis=1)
+        k_max = np.argmax(high == new_y_max[:, None], axis=1)
+
+    if total is None:
+        finite = ~np.isnan(low)
+        new_total = np.add.reduce(low, axis=1, where=finite, initial=0.0)
+        new_count = finite.sum(axis=1)
+    else:
+        new_total = total.reshape(m, factor).sum(axis=1)
+        new_count = count.reshape(m, factor).sum(axis=1)
+
+    return {
+        'x_min': x_min.reshape(m, factor)[rows, k_min],
+        'y_min': new_y_min,
+        'x_max': x_max.reshape(m, factor)[rows, k_max],
+        'y_max': new_y_max,
+        'total': new_total,
+        'count': new_count,
+    }
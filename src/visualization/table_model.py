@@ -0,0 +1,142 @@
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QTableView, QLineEdit, QPushButton, QLabel
+import numpy as np
+import pandas as pd
+
+
+class ColumnTableModel(QAbstractTableModel):
+    """Read-only table model over a DataFrame's arrays, index first, formatting cells on demand."""
+
+    def __init__(self, df: pd.DataFrame, parent=None):
+        super().__init__(parent)
+        self._headers = [str(df.index.name or 'index')] + [str(c) for c in df.columns]
+        self._is_datetime_index = isinstance(df.index, pd.DatetimeIndex)
+        if self._is_datetime_index:
+            index = df.index.tz_convert(None) if df.index.tz is not None else df.index
+            self._index_values = index.as_unit('ns').asi8
+        else:
+            self._index_values = np.asarray(df.index)
+        self._columns = [self._index_values] + [df[c].to_numpy() for c in df.columns]
+        self._rows = len(df)
+        self._order = None
+        self._inverse = None
+        self._sorted_by_time = self._is_datetime_index and df.index.is_monotonic_increasing
+        self._time_order = None
+        self._time_sorted = None
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._rows
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._columns)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.TextAlignmentRole and index.column() > 0:
+            return int(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        row = index.row() if self._order is None else int(self._order[index.row()])
+        value = self._columns[index.column()][row]
+        if index.column() == 0 and self._is_datetime_index:
+            return 'NaT' if value == np.iinfo(np.int64).min else str(pd.Timestamp(int(value)))
+        return _format_value(value)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self._headers[section]
+        return str(section + 1)
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        self.layoutAboutToBeChanged.emit()
+        values = self._columns[column]
+        try:
+            order_idx = np.argsort(values, kind='stable')
+        except TypeError:
+            order_idx = np.argsort(values.astype(str), kind='stable')
+        if order == Qt.SortOrder.DescendingOrder:
+            order_idx = order_idx[::-1]
+        self._order = order_idx
+        self._inverse = None
+        self.layoutChanged.emit()
+
+    def row_for_timestamp(self, timestamp) -> int:
+        """View row of the first entry at or after timestamp, or the last row past the end."""
+        if not self._is_datetime_index or self._rows == 0:
+            raise ValueError("Jump to timestamp requires a datetime index")
+        ts = pd.Timestamp(timestamp)
+        if ts.tzinfo is not None:
+            ts = ts.tz_convert(None)
+        target = ts.value
+        if self._sorted_by_time:
+            source_row = min(int(np.searchsorted(self._index_values, target, side='left')), self._rows - 1)
+        else:
+            if self._time_order is None:
+                valid = np.flatnonzero(self._index_values != np.iinfo(np.int64).min)
+                self._time_order = valid[np.argsort(self._index_values[valid], kind='stable')]
+                self._time_sorted = self._index_values[self._time_order]
+            if len(self._time_order) == 0:
+                raise ValueError("The time index has no valid timestamps")
+            position = min(int(np.searchsorted(self._time_sorted, target, side='left')), len(self._time_order) - 1)
+            source_row = int(self._time_order[position])
+        if self._order is None:
+            return source_row
+        if self._inverse is None:
+            self._inverse = np.empty(self._rows, dtype=np.intp)
+            self._inverse[self._order] = np.arange(self._rows)
+        return int(self._inverse[source_row])
+
+
+class DataTableView(QWidget):
+    def __init__(self, df: pd.DataFrame = None, parent=None):
+        super().__init__(parent)
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        jump_layout = QHBoxLayout()
+        jump_layout.addWidget(QLabel("Jump to timestamp:"))
+        self.jump_edit = QLineEdit(self)
+        self.jump_edit.returnPressed.connect(self._jump)
+        jump_layout.addWidget(self.jump_edit)
+        jump_btn = QPushButton("Go", self)
+        jump_btn.clicked.connect(self._jump)
+        jump_layout.addWidget(jump_btn)
+        layout.addLayout(jump_layout)
+
+        self.view = QTableView(self)
+        self.view.setSortingEnabled(True)
+        self.view.verticalHeader().setDefaultSectionSize(20)
+        self.view.horizontalHeader().setStretchLastSection(True)
+        layout.addWidget(self.view)
+
+        self.model = None
+        if df is not None:
+            self.set_frame(df)
+
+    def set_frame(self, df: pd.DataFrame):
+        self.model = ColumnTableModel(df, self)
+        self.view.setModel(self.model)
+        self.view.horizontalHeader().setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+
+    def _jump(self):
+        text = self.jump_edit.text().strip()
+        if not text or self.model is None:
+            return
+        try:
+            row = self.model.row_for_timestamp(text)
+        except (ValueError, TypeError):
+            return
+        target = self.model.index(row, 0)
+        self.view.scrollTo(target, QTableView.ScrollHint.PositionAtTop)
+        self.view.selectRow(row)
+
+
+def _format_value(value):
+    if isinstance(value, (float, np.floating)):
+        return 'NaN' if np.isnan(value) else f"{value:.6g}"
+    if value is None or value is pd.NaT:
+        return ''
+    return str(value)